@@ -16,29 +16,155 @@ st.set_page_config(
 )
 
 # Security - require authentication
-from core.security import require_authentication
+from core.security import require_authentication, SecurityAudit
 require_authentication()
 
 # Import modules
-from config.events import get_all_events, search_events
+from config.events import get_all_events
 from config.pricing import (
     get_booth_prices, BOOTH_TIER_LABELS, get_add_ons_pricing,
     ADD_ON_CATEGORIES, DISCOUNT_OPTIONS, currency
 )
 from config.settings import (
     SARAH_INFO, COMPLIANCE_TEMPLATES, AUTHORIZED_SIGNATORIES,
-    LOGO_PATHS, USE_BEST_OF_ASCO_NAMING
+    LOGO_PATHS, USE_BEST_OF_ASCO_NAMING, UI_CONFIG
 )
 from core.models import DocumentPayload
 from core.pricing_calc import PricingEngine
 from core.logger import log_generation, get_recent_activity, get_activity_stats
-from generators.lor_generator import generate_lor
-from generators.loa_generator import generate_loa
-from services.multi_meeting import create_multi_meeting_package, generate_multi_meeting_documents
 import datetime as dt
+import functools
+import hashlib
+import json
 from pathlib import Path
 
 
+# ============================================================================
+# LAZY IMPORTS
+# ============================================================================
+
+@functools.lru_cache(maxsize=None)
+def _gens():
+    """LOR/LOA generators, imported on first use (pulls in docx/reportlab)"""
+    from generators.lor_generator import generate_lor
+    from generators.loa_generator import generate_loa
+    return generate_lor, generate_loa
+
+
+@functools.lru_cache(maxsize=None)
+def _multi_meeting():
+    """Multi-meeting package helpers, imported on first use"""
+    from services.multi_meeting import create_multi_meeting_package, generate_multi_meeting_documents
+    return create_multi_meeting_package, generate_multi_meeting_documents
+
+
+# ============================================================================
+# CACHED DATA
+# ============================================================================
+
+@st.cache_data
+def _cached_booth_prices():
+    """Booth prices, read from secrets once per process"""
+    return get_booth_prices()
+
+
+@st.cache_data
+def _cached_addons(year: int):
+    """Add-ons pricing for a given event year"""
+    return get_add_ons_pricing(year)
+
+
+@st.cache_data
+def _booth_options():
+    """BOOTH_OPTIONS tuple (no-booth first) and its option -> index map"""
+    options = ("(no booth)", *_cached_booth_prices().keys())
+    return options, {k: i for i, k in enumerate(options)}
+
+
+@st.cache_data
+def _booth_label_table():
+    """Formatted booth labels ("Tier - $price"), including the no-booth option"""
+    labels = {
+        k: f"{BOOTH_TIER_LABELS.get(k, k)} - {currency(v)}"
+        for k, v in _cached_booth_prices().items()
+    }
+    labels["(no booth)"] = "(No Booth - Add-ons Only)"
+    return labels
+
+
+@st.cache_data
+def _addon_label_table(year: int):
+    """Formatted add-on labels ("Label - $price") for a given event year"""
+    return {
+        k: f"{addon['label']} - {currency(addon['price'])}"
+        for k, addon in _cached_addons(year).items()
+    }
+
+
+@st.cache_data
+def _calc_pricing(booth_tier, add_on_keys, event_year, discount_key, custom_total):
+    """Pricing keyed on its inputs; pass add_on_keys as a sorted tuple"""
+    return PricingEngine.calculate_pricing(
+        booth_tier=booth_tier,
+        add_on_keys=list(add_on_keys),
+        event_year=event_year,
+        discount_key=discount_key,
+        custom_total=custom_total
+    )
+
+
+@st.cache_data(ttl=30)
+def _recent(limit: int):
+    """Recent activity; a short TTL is fresh enough for the footer"""
+    return get_recent_activity(limit=limit)
+
+
+@st.cache_data(ttl=30)
+def _stats():
+    """Activity statistics, refreshed at most every 30 seconds"""
+    return get_activity_stats()
+
+
+@st.cache_resource
+def _resolved_logo():
+    """First existing logo path, resolved once per process"""
+    return next((p for p in LOGO_PATHS if p.exists()), None)
+
+
+@st.cache_data(ttl=3600)
+def _events_by_name():
+    """Events keyed by meeting_name, the canonical id used throughout the UI"""
+    return {e.meeting_name: e for e in get_all_events()}
+
+
+def display_name(e, use_best_of_asco: bool) -> str:
+    """Event name as shown to the user, applying the ASCO naming toggle
+
+    Never mutates the event; cached events are shared across reruns.
+    """
+    if use_best_of_asco and "ASCO Direct" in e.meeting_name:
+        return e.meeting_name.replace("ASCO Direct", "Best of ASCO")
+    return e.meeting_name
+
+
+@st.cache_data(ttl=3600)
+def _event_labels(use_best_of_asco: bool):
+    """Dropdown label ("Name - Date") per meeting_name for the current ASCO naming"""
+    return {
+        name: f"{display_name(e, use_best_of_asco)} - {e.meeting_date_long}"
+        for name, e in _events_by_name().items()
+    }
+
+
+@st.cache_data(ttl=3600)
+def _search_index():
+    """Pair each event with a lowercased haystack so searches are a single pass"""
+    return [
+        (e, f"{e.meeting_name} {e.city_state} {e.venue} {e.meeting_date_long}".lower())
+        for e in get_all_events()
+    ]
+
+
 # ============================================================================
 # CUSTOM STYLING
 # ============================================================================
@@ -101,11 +227,7 @@ st.markdown("""
 # ============================================================================
 
 # Try to display logo
-logo_path = None
-for path in LOGO_PATHS:
-    if path.exists():
-        logo_path = path
-        break
+logo_path = _resolved_logo()
 
 col1, col2 = st.columns([1, 4])
 
@@ -159,8 +281,7 @@ with st.sidebar:
     st.subheader("⚙️ Settings")
 
     # Initialize session state for ASCO naming
-    if 'use_best_of_asco' not in st.session_state:
-        st.session_state.use_best_of_asco = USE_BEST_OF_ASCO_NAMING
+    st.session_state.setdefault('use_best_of_asco', USE_BEST_OF_ASCO_NAMING)
 
     use_best_of_asco = st.toggle(
         "Use 'Best of ASCO' naming",
@@ -192,41 +313,39 @@ if mode == "Single Event":
 
     search_query = st.text_input("🔍 Search Events", placeholder="Type to search...", key="search")
 
-    # Get and filter events
-    all_events = get_all_events()
+    # Get and filter events (by meeting_name)
+    events_by_name = _events_by_name()
 
     if search_query:
-        events = search_events(search_query)
-        st.info(f"Found {len(events)} events matching '{search_query}'")
+        q = search_query.lower()
+        matches = [e.meeting_name for e, haystack in _search_index() if q in haystack]
+        st.info(f"Found {len(matches)} events matching '{search_query}'")
+
+        # Keep the dropdown responsive on broad queries
+        display_max = UI_CONFIG["search_results_max"]
+        events = matches[:display_max]
+        if len(matches) > display_max:
+            st.caption(f"Only showing first {display_max} matches - refine your search to narrow results")
     else:
-        events = all_events
+        events = list(events_by_name)
 
     # Event dropdown with ASCO naming toggle
-    def format_event_name(event):
-        """Format event name based on ASCO naming toggle"""
-        name = event.meeting_name
-        if st.session_state.use_best_of_asco and "ASCO Direct" in name:
-            name = name.replace("ASCO Direct", "Best of ASCO")
-        return f"{name} - {event.meeting_date_long}"
-
-    event_names = [format_event_name(e) for e in events]
+    event_labels = _event_labels(st.session_state.use_best_of_asco)
 
     if not events:
         st.warning("No events found. Try a different search term.")
         st.stop()
 
-    selected_event_idx = st.selectbox(
+    selected_event_name = st.selectbox(
         "Choose Event:",
-        options=range(len(events)),
-        format_func=lambda i: event_names[i],
+        options=events,
+        format_func=event_labels.__getitem__,
         key="event_select"
     )
 
-    selected_event = events[selected_event_idx]
+    selected_event = events_by_name[selected_event_name]
 
-    # Apply ASCO naming to selected event
-    if st.session_state.use_best_of_asco and "ASCO Direct" in selected_event.meeting_name:
-        selected_event.meeting_name = selected_event.meeting_name.replace("ASCO Direct", "Best of ASCO")
+    meeting_name = display_name(selected_event, st.session_state.use_best_of_asco)
 
     # Company information
     st.subheader("2️⃣ Company Information")
@@ -250,16 +369,14 @@ if mode == "Single Event":
     # Booth selection
     st.subheader("3️⃣ Booth Selection")
 
-    booth_prices = get_booth_prices()
-    booth_options = ["(no booth)"] + list(booth_prices.keys())
-    booth_labels = {k: f"{BOOTH_TIER_LABELS.get(k, k)} - {currency(booth_prices.get(k, 0))}" for k in booth_prices.keys()}
-    booth_labels["(no booth)"] = "(No Booth - Add-ons Only)"
+    BOOTH_OPTIONS, BOOTH_OPTION_INDEX = _booth_options()
+    booth_labels = _booth_label_table()
 
     booth_tier = st.selectbox(
         "Booth Tier:",
-        options=booth_options,
+        options=BOOTH_OPTIONS,
         format_func=lambda x: booth_labels.get(x, x),
-        index=booth_options.index(selected_event.default_tier) if selected_event.default_tier in booth_options else 0,
+        index=BOOTH_OPTION_INDEX.get(selected_event.default_tier, 0),
         key="booth"
     )
 
@@ -267,19 +384,20 @@ if mode == "Single Event":
     st.subheader("4️⃣ Add-ons (Optional)")
 
     event_year = selected_event.get_year()
-    add_ons_pricing = get_add_ons_pricing(event_year)
+    addon_labels = _addon_label_table(event_year)
     selected_addons = []
 
     for category, addon_keys in ADD_ON_CATEGORIES.items():
-        with st.expander(category):
-            for key in addon_keys:
-                if key in add_ons_pricing:
-                    addon = add_ons_pricing[key]
-                    if st.checkbox(
-                        f"{addon['label']} - {currency(addon['price'])}",
-                        key=f"addon_{key}"
-                    ):
-                        selected_addons.append(key)
+        options = [k for k in addon_keys if k in addon_labels]
+        if not options:
+            continue
+        picked = st.multiselect(
+            category,
+            options=options,
+            format_func=addon_labels.__getitem__,
+            key=f"cat_{category}"
+        )
+        selected_addons.extend(picked)
 
     # Pricing
     st.subheader("5️⃣ Pricing")
@@ -296,12 +414,12 @@ if mode == "Single Event":
         custom_total = st.number_input("Custom Total Amount:", min_value=0.0, step=50.0, key="custom_total")
 
     # Calculate pricing
-    pricing = PricingEngine.calculate_pricing(
-        booth_tier=booth_tier,
-        add_on_keys=selected_addons,
-        event_year=event_year,
-        discount_key=discount_key,
-        custom_total=custom_total
+    pricing = _calc_pricing(
+        booth_tier,
+        tuple(sorted(selected_addons)),
+        event_year,
+        discount_key,
+        custom_total
     )
 
     # Display pricing
@@ -332,6 +450,39 @@ if mode == "Single Event":
     # Generate button
     st.markdown("---")
 
+    # Get signatory info
+    signatory_info = AUTHORIZED_SIGNATORIES.get(signatory_key, AUTHORIZED_SIGNATORIES["sarah"])
+    signatory_name = f"{signatory_info['name']} - {signatory_info['title']}"
+
+    # Create payload (every run, so downloads can be checked against the current inputs)
+    payload = DocumentPayload(
+        company_name=company_name,
+        company_address=company_address if doc_type == "LOA" else None,
+        meeting_name=meeting_name,
+        meeting_date_long=selected_event.meeting_date_long,
+        venue=selected_event.venue,
+        city_state=selected_event.city_state,
+        booth_selected=booth_tier != "(no booth)",
+        booth_tier=booth_tier,
+        booth_price=pricing.booth_price,
+        add_on_keys=selected_addons,
+        add_ons_total=pricing.add_ons_total,
+        subtotal=pricing.subtotal,
+        discount_applied=pricing.discount_amount,
+        final_total=pricing.rounded_total,
+        amount_currency=currency(pricing.rounded_total),
+        additional_info=additional_info,
+        attendance_expected=attendance if attendance > 0 else None,
+        document_type=doc_type,
+        event_year=event_year,
+        agreement_date=dt.date.today().strftime("%B %d, %Y") if doc_type == "LOA" else None,
+        signature_person=signatory_name if doc_type == "LOA" else SARAH_INFO["name"] + " - " + SARAH_INFO["title"]
+    )
+    payload_dict = payload.to_dict()
+    payload_key = hashlib.blake2b(
+        json.dumps(payload_dict, sort_keys=True, default=str).encode()
+    ).hexdigest()
+
     if st.button("🚀 Generate Documents", type="primary", use_container_width=True):
         if not company_name:
             st.error("Please enter a company name")
@@ -339,74 +490,59 @@ if mode == "Single Event":
             st.error("Please enter a company address for LOA")
         else:
             with st.spinner("Generating documents..."):
-                # Get signatory info
-                signatory_info = AUTHORIZED_SIGNATORIES.get(signatory_key, AUTHORIZED_SIGNATORIES["sarah"])
-                signatory_name = f"{signatory_info['name']} - {signatory_info['title']}"
-
-                # Create payload
-                payload = DocumentPayload(
-                    company_name=company_name,
-                    company_address=company_address if doc_type == "LOA" else None,
-                    meeting_name=selected_event.meeting_name,
-                    meeting_date_long=selected_event.meeting_date_long,
-                    venue=selected_event.venue,
-                    city_state=selected_event.city_state,
-                    booth_selected=booth_tier != "(no booth)",
-                    booth_tier=booth_tier,
-                    booth_price=pricing.booth_price,
-                    add_on_keys=selected_addons,
-                    add_ons_total=pricing.add_ons_total,
-                    subtotal=pricing.subtotal,
-                    discount_applied=pricing.discount_amount,
-                    final_total=pricing.rounded_total,
-                    amount_currency=currency(pricing.rounded_total),
-                    additional_info=additional_info,
-                    attendance_expected=attendance if attendance > 0 else None,
-                    document_type=doc_type,
-                    event_year=event_year,
-                    agreement_date=dt.date.today().strftime("%B %d, %Y") if doc_type == "LOA" else None,
-                    signature_person=signatory_name if doc_type == "LOA" else SARAH_INFO["name"] + " - " + SARAH_INFO["title"]
-                )
-
-                # Generate documents
-                if doc_type == "LOR":
-                    docx_buffer, pdf_buffer = generate_lor(payload.to_dict())
-                else:
-                    docx_buffer, pdf_buffer = generate_loa(payload.to_dict())
-
-                # Log generation
-                log_generation(
-                    company_name=company_name,
-                    meeting_name=selected_event.meeting_name,
-                    document_type=doc_type,
-                    booth_selected=booth_tier,
-                    add_ons=selected_addons,
-                    total_cost=pricing.rounded_total,
-                    mode="single-event"
-                )
+                # Skip regeneration when the same payload was just generated
+                last_doc = st.session_state.get("last_doc")
+                if last_doc is None or last_doc["key"] != payload_key:
+                    # Generate documents
+                    generate_lor, generate_loa = _gens()
+                    if doc_type == "LOR":
+                        docx_buffer, pdf_buffer = generate_lor(payload_dict)
+                    else:
+                        docx_buffer, pdf_buffer = generate_loa(payload_dict)
 
-                st.success("✅ Documents generated successfully!")
+                    # Log generation
+                    log_generation(
+                        company_name=company_name,
+                        meeting_name=meeting_name,
+                        document_type=doc_type,
+                        booth_selected=booth_tier,
+                        add_ons=selected_addons,
+                        total_cost=pricing.rounded_total,
+                        mode="single-event"
+                    )
 
-                # Download buttons
-                col1, col2 = st.columns(2)
+                    st.session_state["last_doc"] = {
+                        "key": payload_key,
+                        "file_stem": f"{doc_type}_{company_name.replace(' ', '_')}_{meeting_name[:30].replace(' ', '_')}",
+                        "docx": docx_buffer.getvalue(),
+                        "pdf": pdf_buffer.getvalue(),
+                    }
 
-                with col1:
-                    st.download_button(
-                        "📄 Download DOCX",
-                        data=docx_buffer,
-                        file_name=f"{doc_type}_{company_name.replace(' ', '_')}_{selected_event.meeting_name[:30].replace(' ', '_')}.docx",
-                        mime="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-                        use_container_width=True
-                    )
+                st.success("✅ Documents generated successfully!")
 
-                with col2:
-                    st.download_button(
-                        "📄 Download PDF",
-                        data=pdf_buffer,
-                        file_name=f"{doc_type}_{company_name.replace(' ', '_')}_{selected_event.meeting_name[:30].replace(' ', '_')}.pdf",
-                        mime="application/pdf",
-                        use_container_width=True
-                    )
+    # Download buttons (kept outside the button branch so they survive reruns,
+    # but only while the inputs still match the generated letter)
+    last_doc = st.session_state.get("last_doc")
+    if last_doc and last_doc["key"] == payload_key:
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.download_button(
+                "📄 Download DOCX",
+                data=last_doc["docx"],
+                file_name=f"{last_doc['file_stem']}.docx",
+                mime="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+                use_container_width=True
+            )
+
+        with col2:
+            st.download_button(
+                "📄 Download PDF",
+                data=last_doc["pdf"],
+                file_name=f"{last_doc['file_stem']}.pdf",
+                mime="application/pdf",
+                use_container_width=True
+            )
 
 
 # ============================================================================
@@ -428,54 +564,52 @@ elif mode == "Multi-Meeting Package":
     # Event selection
     st.subheader("2️⃣ Select Events")
 
-    all_events = get_all_events()
+    events_by_name = _events_by_name()
 
     # Initialize session state for multi-meeting
-    if 'mm_selected_events' not in st.session_state:
-        st.session_state.mm_selected_events = []
-
-    if 'mm_configs' not in st.session_state:
-        st.session_state.mm_configs = {}
-
-    # Event checkboxes
-    for event in all_events[:20]:  # Limit to first 20 for UI performance
-        event_key = f"mm_event_{event.meeting_name}"
-
-        if st.checkbox(
-            f"{event.meeting_name} - {event.meeting_date_long} ({event.city_state})",
-            key=event_key
-        ):
-            if event not in st.session_state.mm_selected_events:
-                st.session_state.mm_selected_events.append(event)
-        elif event in st.session_state.mm_selected_events:
-            st.session_state.mm_selected_events.remove(event)
+    st.session_state.setdefault('mm_configs', {})
+
+    # Single virtualized picker over all events (widget state tracks the selection)
+    selected_names = st.multiselect(
+        "Select events:",
+        options=list(events_by_name),
+        format_func=lambda n: f"{n} - {events_by_name[n].meeting_date_long} ({events_by_name[n].city_state})",
+        placeholder="Type to search events...",
+        key="mm_picker"
+    )
+    selected_events = {n: events_by_name[n] for n in selected_names}
 
-    if st.session_state.mm_selected_events:
-        st.success(f"✅ {len(st.session_state.mm_selected_events)} events selected")
+    if selected_events:
+        st.success(f"✅ {len(selected_events)} events selected")
 
         # Configure each event
         st.subheader("3️⃣ Configure Each Event")
 
+        # Hoist per-rerun invariants out of the per-event loop
         events_configs = []
+        booth_labels = _booth_label_table()
+        BOOTH_OPTIONS, _ = _booth_options()
+        years = {name: e.get_year() for name, e in selected_events.items()}
+        addon_labels_by_year = {y: _addon_label_table(y) for y in set(years.values())}
 
-        for event in st.session_state.mm_selected_events:
+        for name, event in selected_events.items():
             with st.expander(f"⚙️ {event.meeting_name}"):
                 col1, col2 = st.columns(2)
 
                 with col1:
                     booth_tier = st.selectbox(
                         "Booth:",
-                        options=["(no booth)"] + list(get_booth_prices().keys()),
+                        options=BOOTH_OPTIONS,
+                        format_func=lambda x: booth_labels.get(x, x),
                         key=f"mm_booth_{event.meeting_name}"
                     )
 
                 with col2:
-                    event_year = event.get_year()
-                    add_ons_pricing = get_add_ons_pricing(event_year)
+                    addon_labels = addon_labels_by_year[years[name]]
                     selected_addons = st.multiselect(
                         "Add-ons:",
-                        options=list(add_ons_pricing.keys()),
-                        format_func=lambda k: add_ons_pricing[k]["label"],
+                        options=list(addon_labels.keys()),
+                        format_func=lambda k: addon_labels[k],
                         key=f"mm_addons_{event.meeting_name}"
                     )
 
@@ -498,6 +632,7 @@ elif mode == "Multi-Meeting Package":
                     signatory_name = f"{signatory_info['name']} - {signatory_info['title']}"
 
                     # Create package
+                    create_multi_meeting_package, generate_multi_meeting_documents = _multi_meeting()
                     package = create_multi_meeting_package(
                         company_name=company_name,
                         events_configs=events_configs,
@@ -603,7 +738,6 @@ else:  # Excel Bulk
 
     if uploaded_file:
         # Validate file
-        from core.security import SecurityAudit
         is_valid, error_msg = SecurityAudit.validate_file_upload(uploaded_file)
 
         if not is_valid:
@@ -632,8 +766,8 @@ else:  # Excel Bulk
                 validation_report = generate_validation_report(rows)
 
                 # Show stats
-                valid_count = len([r for r in rows if not r.has_errors()])
-                error_count = len([r for r in rows if r.has_errors()])
+                error_count = sum(1 for r in rows if r.has_errors())
+                valid_count = len(rows) - error_count
 
                 col1, col2, col3 = st.columns(3)
 
@@ -735,8 +869,9 @@ else:  # Excel Bulk
 st.markdown("---")
 st.header("📊 Recent Activity")
 
-with st.expander("View Recent Letter Generation"):
-    recent = get_recent_activity(limit=10)
+# Only query the log when the user asks for it
+if st.toggle("View Recent Letter Generation", key="activity_open"):
+    recent = _recent(10)
 
     if recent:
         for log in recent:
@@ -750,7 +885,7 @@ with st.expander("View Recent Letter Generation"):
         st.info("No recent activity")
 
     # Statistics
-    stats = get_activity_stats()
+    stats = _stats()
     col1, col2, col3, col4 = st.columns(4)
 
     with col1:
@@ -3,14 +3,16 @@ Events Database - Total Health Conferencing
 Contains all 2025-2026 conference events with complete metadata
 """
 from typing import List, Dict, Optional
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
 
 
-@dataclass
+@dataclass(frozen=True)
 class Event:
     """
     Represents a single conference event
 
+    Frozen so instances are hashable and safe to share from cached lists.
+
     Attributes:
         meeting_name: Full event name
         meeting_date_long: Human-readable date (e.g., "June 27-28, 2026")
@@ -18,6 +20,8 @@ class Event:
         city_state: City and state (e.g., "Denver, CO")
         default_tier: Default booth tier for this event
         expected_attendance: Expected number of attendees (optional)
+        id: Database primary key (None for hardcoded events)
+        year: Year column from the database (None for hardcoded events)
     """
     meeting_name: str
     meeting_date_long: str
@@ -25,6 +29,8 @@ class Event:
     city_state: str
     default_tier: str
     expected_attendance: Optional[int] = None
+    id: Optional[int] = field(default=None, compare=False)
+    year: Optional[int] = field(default=None, compare=False)
 
     def to_dict(self) -> Dict:
         """Convert event to dictionary"""
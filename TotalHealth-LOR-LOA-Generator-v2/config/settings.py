@@ -181,7 +181,8 @@ COMPLIANCE_TEMPLATES = {
 # ============================================================================
 
 LOGGING_CONFIG = {
-    "log_file": "letter_generation_log.json",
+    "log_file": "letter_generation_log.jsonl",
+    "analytics_cache_file": "analytics_cache.json",
     "max_file_size_mb": 10,
     "max_entries": 500,
     "dangerous_chars": ['<', '>', '"', "'", '&', ';', '(', ')', '{', '}', '[', ']'],
@@ -207,4 +208,5 @@ UI_CONFIG = {
     "events_per_page": 100,
     "log_entries_to_show": 50,
     "search_min_chars": 2,
+    "search_results_max": 200,
 }
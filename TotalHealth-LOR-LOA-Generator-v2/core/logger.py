@@ -2,8 +2,13 @@
 Audit Trail Logger - Total Health Conferencing
 Tracks all letter generation activity for compliance and analytics
 """
+import atexit
+import hashlib
 import json
 import os
+import queue
+import threading
+import time
 from typing import List, Optional
 from pathlib import Path
 from core.models import LetterGenerationLog
@@ -11,12 +16,18 @@ from core.security import sanitize_input, get_current_user_context
 from config.settings import LOGGING_CONFIG
 
 
+def company_key(company_name: str) -> str:
+    """Canonical company key, so "Acme ", "Acme" and "ACME" group together"""
+    return (company_name or "").strip().lower()
+
+
 class AuditLogger:
     """
     Manages audit trail for letter generation
 
     Features:
     - Secure logging with input sanitization
+    - Append-only JSONL storage (one entry per line)
     - Automatic log rotation (max entries)
     - File size limits
     - Search and filtering
@@ -35,6 +46,12 @@ class AuditLogger:
         self.log_file = Path(log_file)
         self.max_file_size_mb = LOGGING_CONFIG["max_file_size_mb"]
         self.max_entries = LOGGING_CONFIG["max_entries"]
+        self._entry_count = None
+        # Serializes appends, rotation and rewrites (the background writer and
+        # log_letter_generation callers can write at the same time)
+        self._write_lock = threading.RLock()
+
+        self._migrate_legacy_log()
 
     def log_letter_generation(
         self,
@@ -64,51 +81,91 @@ class AuditLogger:
             True if logged successfully, False otherwise
         """
         try:
-            # Check file size before writing
-            if not self._check_file_size():
-                return False
-
-            # Sanitize inputs
-            company_name = sanitize_input(company_name)
-            meeting_name = sanitize_input(meeting_name)
-            document_type = sanitize_input(document_type)
-            additional_info = sanitize_input(additional_info)
-
-            # Get user context
-            user_context = get_current_user_context()
-
-            # Create log entry
-            log_entry = LetterGenerationLog.create(
+            return self.write_entry(self.build_entry(
                 company_name=company_name,
                 meeting_name=meeting_name,
                 document_type=document_type,
                 booth_selected=booth_selected,
                 add_ons=add_ons,
                 total_cost=total_cost,
-                additional_info=f"[{mode}] {additional_info}",
-                user_role=user_context["user_role"],
-                session_id=user_context["session_id"],
-            )
+                additional_info=additional_info,
+                mode=mode,
+            ))
 
-            # Load existing log
-            log_data = self._load_log()
+        except Exception as e:
+            # Don't crash the app if logging fails
+            print(f"Warning: Failed to log letter generation: {e}")
+            return False
 
-            # Add new entry
-            log_data["letters"].append(log_entry.to_dict())
+    def build_entry(
+        self,
+        company_name: str,
+        meeting_name: str,
+        document_type: str,
+        booth_selected: Optional[str],
+        add_ons: List[str],
+        total_cost: float,
+        additional_info: str = "",
+        mode: str = "single"
+    ) -> dict:
+        """
+        Build a sanitized log entry for the current user
 
-            # Rotate log if needed
-            if len(log_data["letters"]) > self.max_entries:
-                log_data["letters"] = log_data["letters"][-self.max_entries:]
+        Must run on the request thread: the user context is read from
+        Streamlit session state.
 
-            # Save updated log
-            self._save_log(log_data)
+        Returns:
+            Log entry as a dictionary
+        """
+        # Get user context
+        user_context = get_current_user_context()
+
+        # Create log entry
+        log_entry = LetterGenerationLog.create(
+            company_name=sanitize_input(company_name),
+            meeting_name=sanitize_input(meeting_name),
+            document_type=sanitize_input(document_type),
+            booth_selected=booth_selected,
+            add_ons=add_ons,
+            total_cost=total_cost,
+            additional_info=f"[{mode}] {sanitize_input(additional_info)}",
+            user_role=user_context["user_role"],
+            session_id=user_context["session_id"],
+        )
+        entry = log_entry.to_dict()
+        entry["company_key"] = company_key(entry["company_name"])
+        return entry
+
+    def write_entry(self, entry: dict) -> bool:
+        """
+        Append a prepared log entry to the log file
 
-            return True
+        Args:
+            entry: Entry from build_entry()
 
-        except Exception as e:
-            # Don't crash the app if logging fails
-            print(f"Warning: Failed to log letter generation: {e}")
-            return False
+        Returns:
+            True if written, False if the log file is over its size limit
+        """
+        with self._write_lock:
+            # Check file size before writing
+            if not self._check_file_size():
+                return False
+
+            # Append new entry
+            with open(self.log_file, 'a') as f:
+                f.write(json.dumps(entry) + "\n")
+
+            # Rotate log if needed (with some slack so rotation isn't per write)
+            if self._entry_count is None:
+                self._entry_count = len(self._load_log()["letters"])
+            else:
+                self._entry_count += 1
+
+            if self._entry_count > self.max_entries + self.max_entries // 10:
+                letters = self._load_log()["letters"][-self.max_entries:]
+                self._save_log({"letters": letters})
+
+        return True
 
     def get_all_logs(self) -> List[dict]:
         """Get all log entries"""
@@ -186,7 +243,10 @@ class AuditLogger:
         loa_count = sum(1 for log in all_logs if log.get("document_type") == "LOA")
         total_revenue = sum(log.get("total_cost", 0) for log in all_logs)
 
-        unique_companies = set(log.get("company_name") for log in all_logs if log.get("company_name"))
+        unique_companies = set(
+            log.get("company_key") or company_key(log["company_name"])
+            for log in all_logs if log.get("company_name")
+        )
 
         return {
             "total_letters": len(all_logs),
@@ -211,26 +271,65 @@ class AuditLogger:
             print(f"Error clearing logs: {e}")
             return False
 
+    def backfill_company_keys(self) -> int:
+        """
+        Add company_key to entries written before it was recorded
+
+        Returns:
+            Number of entries updated (the file is only rewritten if > 0)
+        """
+        with self._write_lock:
+            letters = self._load_log()["letters"]
+            updated = 0
+            for entry in letters:
+                if "company_key" not in entry:
+                    entry["company_key"] = company_key(entry.get("company_name", ""))
+                    updated += 1
+
+            if updated:
+                self._save_log({"letters": letters})
+        return updated
+
     # ========================================================================
     # PRIVATE HELPER METHODS
     # ========================================================================
 
     def _load_log(self) -> dict:
         """Load log data from file"""
+        letters = []
         try:
-            if self.log_file.exists():
-                with open(self.log_file, 'r') as f:
-                    return json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
+            with open(self.log_file, 'r') as f:
+                for line in f:
+                    try:
+                        letters.append(json.loads(line))
+                    except json.JSONDecodeError:
+                        continue  # Skip blank or partially written lines
+        except FileNotFoundError:
             pass
 
-        # Return empty log structure
-        return {"letters": []}
+        return {"letters": letters}
 
     def _save_log(self, log_data: dict):
-        """Save log data to file"""
-        with open(self.log_file, 'w') as f:
-            json.dump(log_data, f, indent=2)
+        """Rewrite the log file (replaced atomically, so readers see a new file)"""
+        tmp_file = self.log_file.with_name(self.log_file.name + ".tmp")
+        with open(tmp_file, 'w') as f:
+            for entry in log_data["letters"]:
+                f.write(json.dumps(entry) + "\n")
+        os.replace(tmp_file, self.log_file)
+        self._entry_count = len(log_data["letters"])
+
+    def _migrate_legacy_log(self):
+        """Convert a pre-JSONL log ({"letters": [...]} in a .json file) once"""
+        legacy_file = self.log_file.with_suffix(".json")
+        if legacy_file == self.log_file or self.log_file.exists() or not legacy_file.exists():
+            return
+
+        try:
+            with open(legacy_file, 'r') as f:
+                log_data = json.load(f)
+            self._save_log({"letters": log_data.get("letters", [])})
+        except Exception as e:
+            print(f"Warning: Failed to migrate legacy log: {e}")
 
     def _check_file_size(self) -> bool:
         """Check if log file is within size limits"""
@@ -254,6 +353,63 @@ class AuditLogger:
 audit_logger = AuditLogger()
 
 
+# ============================================================================
+# BACKGROUND WRITER
+# ============================================================================
+
+# Identical submissions within this window are logged once (e.g. double clicks)
+DEDUPE_WINDOW_SECONDS = 5.0
+
+_log_queue: "queue.Queue[dict]" = queue.Queue()
+_recent_hashes: dict = {}
+_recent_lock = threading.Lock()
+_writer_thread: Optional[threading.Thread] = None
+_writer_lock = threading.Lock()
+
+
+def _log_writer():
+    """Drain the log queue, writing entries one at a time"""
+    while True:
+        entry = _log_queue.get()
+        try:
+            audit_logger.write_entry(entry)
+        except Exception as e:
+            print(f"Warning: Failed to log letter generation: {e}")
+        finally:
+            _log_queue.task_done()
+
+
+def _ensure_writer():
+    """Start the daemon writer thread on first use (exactly one, even if sessions race)"""
+    global _writer_thread
+    with _writer_lock:
+        if _writer_thread is None or not _writer_thread.is_alive():
+            _writer_thread = threading.Thread(target=_log_writer, name="audit-log-writer", daemon=True)
+            _writer_thread.start()
+
+
+def _is_duplicate(key: str) -> bool:
+    """True if the same session queued the same submission within DEDUPE_WINDOW_SECONDS"""
+    now = time.monotonic()
+    with _recent_lock:
+        for k, seen in list(_recent_hashes.items()):
+            if now - seen > DEDUPE_WINDOW_SECONDS:
+                del _recent_hashes[k]
+        if key in _recent_hashes:
+            return True
+        _recent_hashes[key] = now
+        return False
+
+
+def flush_logs():
+    """Block until all queued log entries have been written"""
+    if _writer_thread is not None:
+        _log_queue.join()
+
+
+atexit.register(flush_logs)
+
+
 # ============================================================================
 # CONVENIENCE FUNCTIONS
 # ============================================================================
@@ -271,18 +427,42 @@ def log_generation(
     """
     Convenience function to log letter generation
 
-    Uses global audit_logger instance
+    The entry is built on the calling thread and written by a background
+    thread, so file I/O never blocks the UI. Identical submissions from the
+    same session within DEDUPE_WINDOW_SECONDS (re-clicks) are logged once;
+    other sessions are always logged.
+
+    Returns:
+        True if queued (or a re-click in the same session), False if the
+        entry could not be built
     """
-    return audit_logger.log_letter_generation(
-        company_name=company_name,
-        meeting_name=meeting_name,
-        document_type=document_type,
-        booth_selected=booth_selected,
-        add_ons=add_ons,
-        total_cost=total_cost,
-        additional_info=additional_info,
-        mode=mode
-    )
+    try:
+        entry = audit_logger.build_entry(
+            company_name=company_name,
+            meeting_name=meeting_name,
+            document_type=document_type,
+            booth_selected=booth_selected,
+            add_ons=add_ons,
+            total_cost=total_cost,
+            additional_info=additional_info,
+            mode=mode
+        )
+
+        key = hashlib.blake2b(json.dumps(
+            [entry.get("session_id"), company_name, meeting_name, document_type, booth_selected,
+             sorted(add_ons or []), total_cost, additional_info, mode],
+            default=str
+        ).encode()).hexdigest()
+        if _is_duplicate(key):
+            return True
+    except Exception as e:
+        # Don't crash the app if logging fails
+        print(f"Warning: Failed to log letter generation: {e}")
+        return False
+
+    _ensure_writer()
+    _log_queue.put_nowait(entry)
+    return True
 
 
 def get_recent_activity(limit: int = 50) -> List[dict]:
@@ -293,3 +473,10 @@ def get_recent_activity(limit: int = 50) -> List[dict]:
 def get_activity_stats() -> dict:
     """Get activity statistics"""
     return audit_logger.get_statistics()
+
+
+if __name__ == "__main__":
+    # One-time backfill for logs written before company_key was recorded:
+    #   python -m core.logger
+    count = audit_logger.backfill_company_keys()
+    print(f"Added company_key to {count} log entries in {audit_logger.log_file}")
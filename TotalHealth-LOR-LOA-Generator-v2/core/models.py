@@ -7,6 +7,10 @@ from typing import List, Dict, Optional
 from datetime import datetime
 
 
+# Currency symbols and thousands separators dropped when reading amounts
+_CURRENCY_STRIP = str.maketrans('', '', '$,')
+
+
 @dataclass
 class DocumentPayload:
     """
@@ -141,7 +145,7 @@ class ExcelRow:
         """Extract numeric total from total string"""
         try:
             # Remove currency symbols and commas
-            clean = self.total.replace('$', '').replace(',', '').strip()
+            clean = self.total.translate(_CURRENCY_STRIP).strip()
             return float(clean)
         except (ValueError, AttributeError):
             return 0.0
@@ -195,12 +199,13 @@ class LetterGenerationLog:
         )
 
 
-@dataclass
+@dataclass(frozen=True)
 class PricingCalculation:
     """
     Result of pricing calculation
 
-    Tracks booth costs, add-ons, discounts, and final total
+    Tracks booth costs, add-ons, discounts, and final total.
+    Frozen so results can be safely cached and shared.
     """
     booth_tier: str
     booth_price: float
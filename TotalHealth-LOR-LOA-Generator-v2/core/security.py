@@ -13,6 +13,17 @@ from config.settings import SECURITY_CONFIG, LOGGING_CONFIG, LOGO_PATHS
 # INPUT SANITIZATION
 # ============================================================================
 
+# Characters to preserve in business names
+_SAFE_CHARS = {'&', '(', ')', '-', '.', ',', '/', ' ', "'"}
+
+# Deletion tables, built once: strict removes every dangerous character,
+# preserve-common keeps the business-safe ones
+_STRICT_TABLE = str.maketrans('', '', ''.join(LOGGING_CONFIG["dangerous_chars"]))
+_PRESERVE_COMMON_TABLE = str.maketrans('', '', ''.join(
+    char for char in LOGGING_CONFIG["dangerous_chars"] if char not in _SAFE_CHARS
+))
+
+
 def sanitize_input(text: Optional[str], max_length: int = None, preserve_common: bool = True) -> str:
     """
     Sanitize user input to prevent injection attacks
@@ -31,27 +42,9 @@ def sanitize_input(text: Optional[str], max_length: int = None, preserve_common:
     if max_length is None:
         max_length = LOGGING_CONFIG["max_input_length"]
 
-    sanitized = text
-
-    # Define characters to preserve in business names
-    safe_chars = {'&', '(', ')', '-', '.', ',', '/', ' ', "'"}
-
-    # Get dangerous characters list
-    dangerous_chars = LOGGING_CONFIG["dangerous_chars"]
-
-    if preserve_common:
-        # Remove only truly dangerous characters, preserve business-safe ones
-        chars_to_remove = [char for char in dangerous_chars if char not in safe_chars]
-    else:
-        # Remove all dangerous characters (use for untrusted contexts)
-        chars_to_remove = dangerous_chars
-
-    # Remove dangerous characters
-    for char in chars_to_remove:
-        sanitized = sanitized.replace(char, '')
-
-    # Limit length
-    sanitized = sanitized[:max_length]
+    # Remove dangerous characters and limit length
+    table = _PRESERVE_COMMON_TABLE if preserve_common else _STRICT_TABLE
+    sanitized = text.translate(table)[:max_length]
 
     return sanitized
 
@@ -193,6 +186,7 @@ class AuthenticationManager:
         st.session_state["password_expired"] = False
         st.session_state["user_role"] = role
         st.session_state["password_timestamp"] = datetime.now()
+        AuthenticationManager._clear_cached_auth()
 
         # Don't store the actual password
         if "password" in st.session_state:
@@ -222,23 +216,29 @@ class AuthenticationManager:
     @staticmethod
     def get_session_id() -> str:
         """Get unique session ID for logging"""
-        if "session_id" not in st.session_state:
-            # Generate simple session ID from timestamp
-            st.session_state["session_id"] = datetime.now().strftime("%Y%m%d_%H%M%S")
-
-        return st.session_state["session_id"]
+        # Generate simple session ID from timestamp on first use
+        return st.session_state.setdefault("session_id", datetime.now().strftime("%Y%m%d_%H%M%S"))
 
     @staticmethod
     def revoke_access():
         """Revoke current user's access (force re-authentication)"""
         st.session_state["password_correct"] = False
         st.session_state["password_expired"] = True
+        AuthenticationManager._clear_cached_auth()
 
     @staticmethod
     def is_admin() -> bool:
-        """Check if current user has admin privileges"""
-        role = AuthenticationManager.get_current_user_role()
-        return role in ["CEO", "General"]
+        """Check if current user has admin privileges (cached per session)"""
+        if "_is_admin" not in st.session_state:
+            role = AuthenticationManager.get_current_user_role()
+            st.session_state["_is_admin"] = role in ["CEO", "General"]
+        return st.session_state["_is_admin"]
+
+    @staticmethod
+    def _clear_cached_auth():
+        """Drop cached auth results so the next rerun re-verifies"""
+        st.session_state.pop("_authed", None)
+        st.session_state.pop("_is_admin", None)
 
 
 # ============================================================================
@@ -255,10 +255,8 @@ class SecurityAudit:
     @staticmethod
     def log_security_check():
         """Log security access for audit purposes"""
-        if 'security_logged' not in st.session_state:
-            st.session_state.security_logged = True
-            # TODO: Implement full security audit logging if needed
-            pass
+        st.session_state.setdefault('security_logged', True)
+        # TODO: Implement full security audit logging if needed
 
     @staticmethod
     def validate_file_upload(file_obj, max_size_mb: int = 10) -> Tuple[bool, Optional[str]]:
@@ -298,11 +296,18 @@ def require_authentication():
     """
     Require user to be authenticated before continuing
 
-    Use at the top of pages that need authentication
+    Use at the top of pages that need authentication. A successful check is
+    cached in session state so later reruns only re-check expiry.
     """
+    if st.session_state.get("_authed") and not AuthenticationManager._is_password_expired():
+        return
+
     if not AuthenticationManager.check_password():
+        AuthenticationManager._clear_cached_auth()
         st.stop()
 
+    st.session_state["_authed"] = True
+
     # Run security check
     SecurityAudit.log_security_check()
 
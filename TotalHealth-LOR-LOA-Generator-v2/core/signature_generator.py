@@ -6,8 +6,37 @@ from PIL import Image, ImageDraw, ImageFont
 from io import BytesIO
 from pathlib import Path
 from typing import Optional
+from functools import lru_cache
 import os
 
+from config.settings import SARAH_INFO, MICHAEL_INFO, MAUREEN_INFO, ASSETS_DIR
+
+
+# Preferred signature-style fonts (in order of preference)
+PREFERRED_SIGNATURE_FONTS = [
+    'Brush Script MT',
+    'Lucida Handwriting',
+    'Segoe Script',
+    'Comic Sans MS',  # Not ideal but better than nothing
+]
+
+# First installed font from PREFERRED_SIGNATURE_FONTS; None = not probed yet,
+# False = none available (use PIL's default font)
+_RESOLVED_FAMILY = None
+
+
+def _resolve_family():
+    """Probe PREFERRED_SIGNATURE_FONTS once and remember the first that loads"""
+    global _RESOLVED_FAMILY
+    for font_name in PREFERRED_SIGNATURE_FONTS:
+        try:
+            ImageFont.truetype(font_name, 12)
+            _RESOLVED_FAMILY = font_name
+            return
+        except (OSError, IOError):
+            continue
+    _RESOLVED_FAMILY = False
+
 
 class SignatureGenerator:
     """
@@ -23,7 +52,7 @@ class SignatureGenerator:
         height: int = 100,
         font_size: int = 48,
         color: str = "#000080"
-    ) -> BytesIO:
+    ) -> bytes:
         """
         Generate a signature-style image from a name
 
@@ -35,7 +64,7 @@ class SignatureGenerator:
             color: Signature color (default navy blue)
 
         Returns:
-            BytesIO object containing PNG signature image
+            PNG signature image bytes
         """
         # Create transparent image
         img = Image.new('RGBA', (width, height), (255, 255, 255, 0))
@@ -59,34 +88,29 @@ class SignatureGenerator:
         # underline_y = y + text_height + 5
         # draw.line([(x, underline_y), (x + text_width, underline_y)], fill=color, width=2)
 
-        # Save to BytesIO
+        # Encode as PNG
         buffer = BytesIO()
         img.save(buffer, format='PNG')
-        buffer.seek(0)
 
-        return buffer
+        return buffer.getvalue()
 
     @staticmethod
+    @lru_cache(maxsize=16)
     def _get_signature_font(size: int):
         """
         Get the best available signature-style font
 
-        Tries cursive/script fonts, falls back to bold italic
+        Uses the cursive/script font resolved by _resolve_family(), falling
+        back to PIL's default. Cached per size.
         """
-        # List of preferred signature-style fonts (in order of preference)
-        preferred_fonts = [
-            'Brush Script MT',
-            'Lucida Handwriting',
-            'Segoe Script',
-            'Comic Sans MS',  # Not ideal but better than nothing
-        ]
-
-        # Try each preferred font
-        for font_name in preferred_fonts:
+        if _RESOLVED_FAMILY is None:
+            _resolve_family()
+
+        if _RESOLVED_FAMILY:
             try:
-                return ImageFont.truetype(font_name, size)
+                return ImageFont.truetype(_RESOLVED_FAMILY, size)
             except (OSError, IOError):
-                continue
+                pass
 
         # Fall back to default font
         try:
@@ -102,8 +126,6 @@ class SignatureGenerator:
         Args:
             output_dir: Directory to save signatures (default: assets/)
         """
-        from config.settings import SARAH_INFO, MICHAEL_INFO, MAUREEN_INFO, ASSETS_DIR
-
         if output_dir is None:
             output_dir = ASSETS_DIR
 
@@ -122,7 +144,7 @@ class SignatureGenerator:
                 print(f"✓ Sarah's signature already exists, skipping")
                 continue
 
-            signature_buffer = SignatureGenerator.generate_signature(
+            signature_bytes = SignatureGenerator.generate_signature(
                 name=name,
                 width=400,
                 height=100,
@@ -132,28 +154,50 @@ class SignatureGenerator:
 
             # Save to file
             output_path = output_dir / f'{key}_signature_generated.png'
-            with open(output_path, 'wb') as f:
-                f.write(signature_buffer.getvalue())
+            output_path.write_bytes(signature_bytes)
 
             print(f"✓ Generated signature for {name} -> {output_path}")
 
+        # New files on disk invalidate the cached lookups
+        _resolve_signature_file.cache_clear()
+        _cached_signature_bytes.cache_clear()
+
 
 # ============================================================================
 # CONVENIENCE FUNCTIONS
 # ============================================================================
 
-def get_signature_for_person(person_key: str) -> Optional[BytesIO]:
+@lru_cache(maxsize=8)
+def _resolve_signature_file(person_key: str) -> Optional[Path]:
     """
-    Get signature image for a specific person
+    Find the first existing signature file for a person (cached per process)
 
     Args:
         person_key: 'sarah', 'michael', or 'maureen'
 
     Returns:
-        BytesIO with signature image, or None if not found
+        Path to signature file, or None if none exists
     """
-    from config.settings import SARAH_INFO, MICHAEL_INFO, MAUREEN_INFO, ASSETS_DIR
+    signature_files = [
+        ASSETS_DIR / f'{person_key}_signature.jpg',
+        ASSETS_DIR / f'{person_key}_signature.png',
+        ASSETS_DIR / f'{person_key}_signature_generated.png',
+    ]
+
+    return next((sig_file for sig_file in signature_files if sig_file.exists()), None)
+
 
+@lru_cache(maxsize=8)
+def _cached_signature_bytes(person_key: str) -> Optional[bytes]:
+    """
+    Load (or generate) a person's signature once per process
+
+    Args:
+        person_key: 'sarah', 'michael', or 'maureen'
+
+    Returns:
+        PNG/JPEG signature bytes, or None if person is unknown
+    """
     # Map person to their info
     person_map = {
         'sarah': SARAH_INFO['name'],
@@ -165,23 +209,33 @@ def get_signature_for_person(person_key: str) -> Optional[BytesIO]:
         return None
 
     # Check for existing signature files first
-    signature_files = [
-        ASSETS_DIR / f'{person_key}_signature.jpg',
-        ASSETS_DIR / f'{person_key}_signature.png',
-        ASSETS_DIR / f'{person_key}_signature_generated.png',
-    ]
-
-    for sig_file in signature_files:
-        if sig_file.exists():
-            with open(sig_file, 'rb') as f:
-                buffer = BytesIO(f.read())
-                buffer.seek(0)
-                return buffer
+    sig_file = _resolve_signature_file(person_key)
+    if sig_file is not None:
+        return sig_file.read_bytes()
 
-    # If no file exists, generate one on the fly
+    # If no file exists, generate one
     return SignatureGenerator.generate_signature(person_map[person_key])
 
 
+def get_signature_for_person(person_key: str) -> Optional[BytesIO]:
+    """
+    Get signature image for a specific person
+
+    Args:
+        person_key: 'sarah', 'michael', or 'maureen'
+
+    Returns:
+        BytesIO with signature image, or None if not found
+    """
+    signature_bytes = _cached_signature_bytes(person_key)
+
+    if signature_bytes is None:
+        return None
+
+    # Fresh buffer per caller; the cached bytes are shared
+    return BytesIO(signature_bytes)
+
+
 def has_signature_file(person_key: str) -> bool:
     """
     Check if a signature file exists for a person
@@ -192,12 +246,4 @@ def has_signature_file(person_key: str) -> bool:
     Returns:
         True if signature file exists
     """
-    from config.settings import ASSETS_DIR
-
-    signature_files = [
-        ASSETS_DIR / f'{person_key}_signature.jpg',
-        ASSETS_DIR / f'{person_key}_signature.png',
-        ASSETS_DIR / f'{person_key}_signature_generated.png',
-    ]
-
-    return any(sig_file.exists() for sig_file in signature_files)
+    return _resolve_signature_file(person_key) is not None
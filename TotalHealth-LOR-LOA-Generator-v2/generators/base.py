@@ -3,7 +3,8 @@ Base Document Generator - Total Health Conferencing
 Abstract base classes for document generation
 """
 from abc import ABC, abstractmethod
-from typing import List, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional, Tuple
 from io import BytesIO
 from pathlib import Path
 from config.settings import ASSETS_DIR, LOGO_PATHS, SIGNATURE_PATHS
@@ -58,6 +59,21 @@ class BaseDocumentGenerator(ABC):
         """
         pass
 
+    def generate_documents(self) -> Tuple[BytesIO, BytesIO]:
+        """
+        Generate DOCX and PDF concurrently
+
+        Each format uses its own builder instance, so the two renders share
+        no mutable state and can overlap.
+
+        Returns:
+            Tuple of (docx_buffer, pdf_buffer)
+        """
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            docx_future = executor.submit(self.generate_docx)
+            pdf_future = executor.submit(self.generate_pdf)
+            return docx_future.result(), pdf_future.result()
+
     # ========================================================================
     # ASSET LOADING HELPERS
     # ========================================================================
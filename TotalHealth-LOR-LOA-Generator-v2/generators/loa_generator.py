@@ -442,6 +442,4 @@ def generate_loa(payload: Dict) -> tuple:
         Tuple of (docx_buffer, pdf_buffer)
     """
     generator = LOAGenerator(payload)
-    docx_buffer = generator.generate_docx()
-    pdf_buffer = generator.generate_pdf()
-    return docx_buffer, pdf_buffer
+    return generator.generate_documents()
@@ -265,6 +265,4 @@ def generate_lor(payload: Dict) -> tuple:
         Tuple of (docx_buffer, pdf_buffer)
     """
     generator = LORGenerator(payload)
-    docx_buffer = generator.generate_docx()
-    pdf_buffer = generator.generate_pdf()
-    return docx_buffer, pdf_buffer
+    return generator.generate_documents()
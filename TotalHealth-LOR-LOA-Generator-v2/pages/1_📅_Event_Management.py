@@ -3,6 +3,8 @@ Event Management Page - Total Health Conferencing
 Admin interface for managing event calendar
 """
 import streamlit as st
+import pandas as pd
+import math
 from services.event_database import (
     get_database,
     migrate_hardcoded_events,
@@ -10,6 +12,7 @@ from services.event_database import (
 )
 from config.events import Event
 from core.security import require_authentication, AuthenticationManager
+from config.settings import UI_CONFIG
 
 # ============================================================================
 # PAGE CONFIGURATION
@@ -40,6 +43,41 @@ st.markdown("Manage events for LOR/LOA generation")
 # Initialize database
 db = get_database()
 
+
+# ============================================================================
+# CACHED QUERIES
+# ============================================================================
+
+@st.cache_data(ttl=300)
+def _cached_count():
+    return db.count_events()
+
+
+@st.cache_data(ttl=300)
+def _cached_years():
+    return db.get_years()
+
+
+@st.cache_data(ttl=300)
+def _cached_all_events():
+    return db.get_all_events()
+
+
+def _events_by_year():
+    """Events grouped by year, from the one cached query, for in-memory filtering"""
+    events_by_year = {}
+    for event in _cached_all_events():  # Already newest year first
+        events_by_year.setdefault(event.year, []).append(event)
+    return events_by_year
+
+
+def _clear_event_caches():
+    """Invalidate cached queries after the events table changes (for every session)"""
+    _cached_count.clear()
+    _cached_years.clear()
+    _cached_all_events.clear()
+
+
 # ============================================================================
 # STATISTICS
 # ============================================================================
@@ -47,15 +85,15 @@ db = get_database()
 col1, col2, col3 = st.columns(3)
 
 with col1:
-    st.metric("Total Events", db.count_events())
+    st.metric("Total Events", _cached_count())
 
 with col2:
-    years = db.get_years()
+    years = _cached_years()
     st.metric("Years", len(years))
 
 with col3:
     current_year = 2025
-    current_year_count = len(db.get_all_events(year=current_year))
+    current_year_count = len(_events_by_year().get(current_year, []))
     st.metric(f"{current_year} Events", current_year_count)
 
 st.markdown("---")
@@ -87,39 +125,63 @@ with tab1:
     with col2:
         filter_year = st.selectbox(
             "Filter by Year",
-            options=["All Years"] + [str(y) for y in sorted(db.get_years(), reverse=True)]
+            options=["All Years"] + [str(y) for y in sorted(_cached_years(), reverse=True)]
         )
 
-    # Get events
+    # Get events (filtered in memory; already newest year first)
     if search_query:
-        events = db.search_events(search_query)
+        query = search_query.lower()
+        events = sorted(
+            (e for e in _cached_all_events() if query in e.meeting_name.lower()),
+            key=lambda e: e.meeting_date_long
+        )
     elif filter_year != "All Years":
-        events = db.get_all_events(year=int(filter_year))
+        events = _events_by_year().get(int(filter_year), [])
     else:
-        events = db.get_all_events()
+        events = _cached_all_events()
 
     st.info(f"📊 Showing {len(events)} events")
 
-    # Display events in table
+    # Display one page of events in a (virtualized) table
     if events:
-        for event in events:
-            with st.expander(f"📅 {event.meeting_name} ({event.get_year()})"):
-                col1, col2 = st.columns([3, 1])
+        page_size = UI_CONFIG["events_per_page"]
+        page_count = math.ceil(len(events) / page_size)
+        page = st.number_input("Page", min_value=1, max_value=page_count, value=1, step=1) if page_count > 1 else 1
+        page_events = events[(page - 1) * page_size:page * page_size]
+
+        st.dataframe(
+            pd.DataFrame(
+                [(e.meeting_name, e.meeting_date_long, e.venue, e.city_state, e.year) for e in page_events],
+                columns=["Name", "Date", "Venue", "City/State", "Year"]
+            ),
+            use_container_width=True,
+            hide_index=True
+        )
 
-                with col1:
-                    st.markdown(f"**Date:** {event.meeting_date_long}")
-                    st.markdown(f"**Venue:** {event.venue}")
-                    st.markdown(f"**Location:** {event.city_state}")
-                    st.markdown(f"**Year:** {event.get_year()}")
+        # Delete an event from the current page
+        col1, col2 = st.columns([3, 1])
+
+        event_names = {e.id: e.meeting_name for e in page_events}
+
+        with col1:
+            delete_id = st.selectbox(
+                "Select event to delete",
+                options=list(event_names),
+                format_func=event_names.get,
+                key="delete_event"
+            )
 
-                with col2:
-                    # Get event from DB to get ID
-                    db_event = db.get_event_by_name(event.meeting_name)
+            # Keyed per event, so picking another event needs a fresh confirmation
+            confirm_delete = st.checkbox(
+                f"Yes, permanently delete '{event_names[delete_id]}'",
+                key=f"confirm_delete_{delete_id}"
+            )
 
-                    if db_event and st.button(f"🗑️ Delete", key=f"del_{event.meeting_name}"):
-                        # We need the ID from the database
-                        # For now, delete by name matching
-                        st.warning("Delete functionality requires event ID from database")
+        with col2:
+            if st.button("🗑️ Delete", use_container_width=True, disabled=not confirm_delete):
+                db.delete_event(delete_id)
+                _clear_event_caches()
+                st.rerun()
 
     else:
         st.info("No events found. Add events or import from CSV.")
@@ -176,15 +238,21 @@ with tab2:
                         meeting_date_long=meeting_date,
                         venue=venue,
                         city_state=city_state,
-                        year=year
+                        year=year,
+                        ignore_duplicates=True
                     )
-                    st.success(f"✅ Event added successfully! (ID: {event_id})")
-                    st.balloons()
-                except Exception as e:
-                    if "UNIQUE constraint" in str(e):
+                    if not event_id:
                         st.error("❌ Event with this name already exists")
                     else:
-                        st.error(f"❌ Failed to add event: {str(e)}")
+                        _clear_event_caches()
+                        st.success(f"✅ Event added successfully! (ID: {event_id})")
+
+                        # Celebrate the first add of the session only
+                        if not st.session_state.get("balloons_shown"):
+                            st.balloons()
+                            st.session_state.balloons_shown = True
+                except Exception as e:
+                    st.error(f"❌ Failed to add event: {str(e)}")
 
 # ============================================================================
 # TAB 3: IMPORT/EXPORT
@@ -219,6 +287,7 @@ with tab3:
                     success, errors, error_msgs = db.import_from_csv(uploaded_file)
 
                 if success > 0:
+                    _clear_event_caches()
                     st.success(f"✅ Imported {success} events successfully!")
 
                 if errors > 0:
@@ -243,7 +312,7 @@ with tab3:
             st.download_button(
                 "📥 Download CSV",
                 data=csv_buffer,
-                file_name=f"events_export_{db.count_events()}_events.csv",
+                file_name=f"events_export_{_cached_count()}_events.csv",
                 mime="text/csv",
                 use_container_width=True
             )
@@ -265,6 +334,7 @@ with tab4:
     if st.button("🚀 Migrate Hardcoded Events", type="primary"):
         with st.spinner("Migrating events..."):
             success, duplicates = migrate_hardcoded_events()
+            _clear_event_caches()
 
         st.success(f"✅ Migration complete!")
         st.metric("Events Added", success)
@@ -277,4 +347,4 @@ with tab4:
 # ============================================================================
 
 st.markdown("---")
-st.caption(f"Event Management System | Total Events: {db.count_events()}")
+st.caption(f"Event Management System | Total Events: {_cached_count()}")
@@ -0,0 +1,203 @@
+"""
+Analytics - Total Health Conferencing
+Incremental aggregation of the activity log for the analytics dashboard
+"""
+import json
+import os
+from collections import Counter
+from datetime import datetime
+from heapq import nlargest
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Dict
+
+from core.logger import company_key
+
+
+# ============================================================================
+# AGGREGATES
+# ============================================================================
+
+# Bump when the aggregate layout changes so old sidecar caches are rebuilt
+AGGREGATES_VERSION = 3
+
+# Per-key tallies kept in the aggregates (Counters; saved to JSON as plain dicts)
+AGGREGATE_TALLIES = (
+    'doc_types', 'modes', 'user_activity', 'event_revenue', 'event_counts',
+    'booth_counts', 'booth_revenue', 'addon_counts',
+)
+
+
+def iter_log(f):
+    """Yield (line length, entry) for each complete JSONL line from f's position"""
+    for line in f:
+        if not line.endswith(b"\n"):
+            break  # Entry still being written
+        try:
+            yield len(line), json.loads(line)
+        except json.JSONDecodeError:
+            yield len(line), None
+
+
+def empty_aggregates(inode: int) -> Dict:
+    """Aggregates for an empty log file"""
+    agg = {
+        'version': AGGREGATES_VERSION,
+        'inode': inode,
+        'offset': 0,
+        'total_documents': 0,
+        'total_revenue': 0,
+        'companies': [],
+        'earliest': None,
+        'latest': None,
+    }
+    agg.update({name: Counter() for name in AGGREGATE_TALLIES})
+    agg['company_activity'] = {}
+    return agg
+
+
+def fold_entry(agg: Dict, companies: set, entry: Dict):
+    """Add one log entry to the running aggregates"""
+    cost = entry.get('total_cost', 0)
+    event = entry.get('meeting_name', 'Unknown')
+    company = entry.get('company_name', 'Unknown')
+    key = entry.get('company_key') or company_key(company)
+    booth = entry.get('booth_selected', 'None')
+
+    agg['total_documents'] += 1
+    agg['total_revenue'] += cost
+    companies.add(key)
+
+    ts = entry.get('timestamp')
+    if ts is not None:
+        if agg['earliest'] is None or ts < agg['earliest']:
+            agg['earliest'] = ts
+        if agg['latest'] is None or ts > agg['latest']:
+            agg['latest'] = ts
+
+    for name, bucket in (
+        ('doc_types', entry.get('document_type', 'Unknown')),
+        ('modes', entry.get('mode', 'single-event')),
+        ('user_activity', entry.get('user_role', 'Unknown')),
+        ('event_counts', event),
+    ):
+        agg[name][bucket] += 1
+
+    agg['event_revenue'][event] += cost
+
+    if booth and booth != 'None':
+        agg['booth_counts'][booth] += 1
+        agg['booth_revenue'][booth] += cost
+
+    agg['addon_counts'].update(entry.get('add_ons', []))
+
+    # Keyed on the normalized name; shown under the first spelling seen
+    activity = agg['company_activity'].setdefault(key, {'name': company, 'count': 0, 'revenue': 0})
+    activity['count'] += 1
+    activity['revenue'] += cost
+
+
+def update_aggregates(log_file: Path, cache_file: Path, size: int) -> Dict:
+    """
+    Aggregate the activity log, folding in only lines added since last time
+
+    Aggregates and the byte offset they cover are persisted in cache_file
+    next to the log. A rotated log (new inode or shorter file) is re-read
+    from the start.
+
+    Args:
+        log_file: JSONL activity log
+        cache_file: Sidecar file for the aggregates
+        size: Current size of log_file in bytes
+
+    Returns:
+        Aggregates dictionary (tallies as Counters)
+    """
+    inode = log_file.stat().st_ino
+
+    try:
+        with open(cache_file, 'r') as f:
+            agg = json.load(f)
+        if (agg.get('version') != AGGREGATES_VERSION or agg.get('inode') != inode
+                or agg.get('offset', 0) > size):
+            agg = empty_aggregates(inode)
+        else:
+            for name in AGGREGATE_TALLIES:
+                agg[name] = Counter(agg[name])
+    except Exception:
+        agg = empty_aggregates(inode)
+
+    start = agg['offset']
+    companies = set(agg['companies'])
+
+    with open(log_file, 'rb') as f:
+        f.seek(start)
+        for length, entry in iter_log(f):
+            agg['offset'] += length
+            if entry is not None:
+                fold_entry(agg, companies, entry)
+
+    agg['companies'] = sorted(companies)
+
+    if agg['offset'] != start:
+        try:
+            tmp_file = cache_file.with_name(cache_file.name + ".tmp")
+            with open(tmp_file, 'w') as f:
+                json.dump(agg, f)
+            os.replace(tmp_file, cache_file)
+        except OSError:
+            pass  # Cache is an optimisation only
+
+    return agg
+
+
+def summarize(agg: Dict) -> SimpleNamespace:
+    """
+    Everything the page renders: summary stats plus each tab's table rows
+
+    Tabs only look these up, so switching tabs never re-sorts the tallies.
+    """
+    total_documents = agg['total_documents']
+    total_revenue = agg['total_revenue']
+    booth_revenue = agg['booth_revenue']
+
+    # Time range
+    if agg['earliest']:
+        earliest = datetime.fromisoformat(agg['earliest'])
+        latest = datetime.fromisoformat(agg['latest'])
+        days_active = (latest - earliest).days + 1
+    else:
+        days_active = 1
+
+    return SimpleNamespace(
+        total_documents=total_documents,
+        total_revenue=total_revenue,
+        unique_companies=len(agg['companies']),
+        days_active=days_active,
+        avg_per_doc=total_revenue / total_documents if total_documents > 0 else 0,
+        latest_ts=agg['latest'],
+        # Tab 1: Overview
+        doc_type_rows=[
+            (doc_type, count, count / total_documents * 100)
+            for doc_type, count in agg['doc_types'].most_common()
+        ],
+        mode_rows=[
+            (mode.replace('-', ' ').title(), count, count / total_documents * 100)
+            for mode, count in agg['modes'].most_common()
+        ],
+        user_rows=agg['user_activity'].most_common(),
+        # Tab 2: Revenue
+        top_event_revenue=agg['event_revenue'].most_common(10),
+        booth_rows=[
+            (booth, count, booth_revenue[booth])
+            for booth, count in agg['booth_counts'].most_common()
+        ],
+        # Tab 3: Events
+        top_events=agg['event_counts'].most_common(15),
+        top_addons=agg['addon_counts'].most_common(10),
+        # Tab 4: Companies
+        top_companies=[
+            (data['name'], data['count'], data['revenue'], data['revenue'] / data['count'] if data['count'] > 0 else 0)
+            for data in nlargest(20, agg['company_activity'].values(), key=lambda x: x['count'])
+        ],
+    )
@@ -2,12 +2,14 @@
 Email Service - Total Health Conferencing
 SMTP email sending for LOA/LOR delivery with tracking
 """
+import html
 import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from email.mime.application import MIMEApplication
+from string import Template
+from email.message import EmailMessage
 from typing import List, Optional, Tuple
 from io import BytesIO
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from datetime import datetime
 import streamlit as st
 
@@ -16,75 +18,74 @@ import streamlit as st
 # EMAIL CONFIGURATION
 # ============================================================================
 
+# Parallel SMTP sessions used by send_bulk_emails
+BULK_SEND_WORKERS = 4
+
+
+@lru_cache(maxsize=1)
+def _smtp_config() -> dict:
+    """Read SMTP settings from secrets once per process"""
+    try:
+        return {
+            'server': st.secrets.get('smtp_server', 'smtp.gmail.com'),
+            'port': st.secrets.get('smtp_port', 587),
+            'username': st.secrets.get('smtp_username', ''),
+            'password': st.secrets.get('smtp_password', ''),
+            'from_email': st.secrets.get('smtp_from_email', ''),
+            'from_name': st.secrets.get('smtp_from_name', 'Total Health Conferencing'),
+        }
+    except Exception:
+        # Return defaults if secrets not configured
+        return {
+            'server': 'smtp.gmail.com',
+            'port': 587,
+            'username': '',
+            'password': '',
+            'from_email': '',
+            'from_name': 'Total Health Conferencing',
+        }
+
+
+@lru_cache(maxsize=1)
+def _smtp_configured() -> bool:
+    config = _smtp_config()
+    return bool(config['username'] and config['password'] and config['from_email'])
+
+
 class EmailConfig:
     """Email configuration from Streamlit secrets"""
 
     @staticmethod
     def get_smtp_config() -> dict:
         """
-        Get SMTP configuration from secrets
+        Get SMTP configuration from secrets (cached per process)
 
         Returns:
             Dictionary with SMTP settings
         """
-        try:
-            return {
-                'server': st.secrets.get('smtp_server', 'smtp.gmail.com'),
-                'port': st.secrets.get('smtp_port', 587),
-                'username': st.secrets.get('smtp_username', ''),
-                'password': st.secrets.get('smtp_password', ''),
-                'from_email': st.secrets.get('smtp_from_email', ''),
-                'from_name': st.secrets.get('smtp_from_name', 'Total Health Conferencing'),
-            }
-        except Exception:
-            # Return defaults if secrets not configured
-            return {
-                'server': 'smtp.gmail.com',
-                'port': 587,
-                'username': '',
-                'password': '',
-                'from_email': '',
-                'from_name': 'Total Health Conferencing',
-            }
+        return dict(_smtp_config())
 
     @staticmethod
     def is_configured() -> bool:
         """Check if email is configured"""
-        config = EmailConfig.get_smtp_config()
-        return bool(config['username'] and config['password'] and config['from_email'])
+        return _smtp_configured()
 
 
 # ============================================================================
 # EMAIL TEMPLATES
 # ============================================================================
 
-class EmailTemplates:
-    """Professional email templates for document delivery"""
-
-    @staticmethod
-    def get_lor_template(company_name: str, event_name: str) -> Tuple[str, str]:
-        """
-        Get email template for LOR delivery
-
-        Args:
-            company_name: Company name
-            event_name: Event name
-
-        Returns:
-            Tuple of (subject, body_html)
-        """
-        subject = f"Letter of Recognition - {event_name}"
-
-        body = f"""
+# Bodies are compiled once; values are HTML-escaped at substitution time
+_LOR_TMPL = Template("""
         <html>
         <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
             <div style="max-width: 600px; margin: 0 auto; padding: 20px;">
                 <h2 style="color: #013955;">Letter of Recognition</h2>
 
-                <p>Dear {company_name} Team,</p>
+                <p>Dear $company_name Team,</p>
 
                 <p>
-                    Thank you for your interest in <strong>{event_name}</strong>.
+                    Thank you for your interest in <strong>$event_name</strong>.
                     We are pleased to provide you with our Letter of Recognition (LOR).
                 </p>
 
@@ -115,34 +116,18 @@ class EmailTemplates:
             </div>
         </body>
         </html>
-        """
-
-        return subject, body
-
-    @staticmethod
-    def get_loa_template(company_name: str, event_name: str) -> Tuple[str, str]:
-        """
-        Get email template for LOA delivery
-
-        Args:
-            company_name: Company name
-            event_name: Event name
-
-        Returns:
-            Tuple of (subject, body_html)
-        """
-        subject = f"Letter of Agreement - {event_name}"
+        """)
 
-        body = f"""
+_LOA_TMPL = Template("""
         <html>
         <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
             <div style="max-width: 600px; margin: 0 auto; padding: 20px;">
                 <h2 style="color: #013955;">Letter of Agreement</h2>
 
-                <p>Dear {company_name} Team,</p>
+                <p>Dear $company_name Team,</p>
 
                 <p>
-                    Thank you for choosing to participate in <strong>{event_name}</strong>.
+                    Thank you for choosing to participate in <strong>$event_name</strong>.
                     We are pleased to provide you with our Letter of Agreement (LOA).
                 </p>
 
@@ -182,7 +167,51 @@ class EmailTemplates:
             </div>
         </body>
         </html>
+        """)
+
+
+class EmailTemplates:
+    """Professional email templates for document delivery"""
+
+    @staticmethod
+    def get_lor_template(company_name: str, event_name: str) -> Tuple[str, str]:
+        """
+        Get email template for LOR delivery
+
+        Args:
+            company_name: Company name
+            event_name: Event name
+
+        Returns:
+            Tuple of (subject, body_html)
+        """
+        subject = f"Letter of Recognition - {event_name}"
+
+        body = _LOR_TMPL.substitute(
+            company_name=html.escape(company_name or ""),
+            event_name=html.escape(event_name or "")
+        )
+
+        return subject, body
+
+    @staticmethod
+    def get_loa_template(company_name: str, event_name: str) -> Tuple[str, str]:
+        """
+        Get email template for LOA delivery
+
+        Args:
+            company_name: Company name
+            event_name: Event name
+
+        Returns:
+            Tuple of (subject, body_html)
         """
+        subject = f"Letter of Agreement - {event_name}"
+
+        body = _LOA_TMPL.substitute(
+            company_name=html.escape(company_name or ""),
+            event_name=html.escape(event_name or "")
+        )
 
         return subject, body
 
@@ -236,63 +265,19 @@ class EmailSender:
         config = EmailConfig.get_smtp_config()
 
         try:
-            # Get email template
-            if document_type == "LOA":
-                subject, body_html = EmailTemplates.get_loa_template(company_name, event_name)
-            else:
-                subject, body_html = EmailTemplates.get_lor_template(company_name, event_name)
-
-            # Create message
-            msg = MIMEMultipart('mixed')
-            msg['Subject'] = subject
-            msg['From'] = f"{config['from_name']} <{config['from_email']}>"
-            msg['To'] = to_email
-
-            if cc:
-                msg['Cc'] = ', '.join(cc)
-            if bcc:
-                msg['Bcc'] = ', '.join(bcc)
-
-            # Add HTML body
-            html_part = MIMEText(body_html, 'html')
-            msg.attach(html_part)
-
-            # Add PDF attachment
-            pdf_buffer.seek(0)
-            pdf_attachment = MIMEApplication(pdf_buffer.read(), _subtype='pdf')
-            pdf_attachment.add_header('Content-Disposition', 'attachment',
-                                     filename=f'{document_type}_{company_name.replace(" ", "_")}.pdf')
-            msg.attach(pdf_attachment)
-
-            # Add DOCX attachment
-            docx_buffer.seek(0)
-            docx_attachment = MIMEApplication(docx_buffer.read(),
-                                            _subtype='vnd.openxmlformats-officedocument.wordprocessingml.document')
-            docx_attachment.add_header('Content-Disposition', 'attachment',
-                                      filename=f'{document_type}_{company_name.replace(" ", "_")}.docx')
-            msg.attach(docx_attachment)
-
-            # Build recipient list
-            recipients = [to_email]
-            if cc:
-                recipients.extend(cc)
-            if bcc:
-                recipients.extend(bcc)
+            msg = EmailSender._build_message(
+                config, to_email, company_name, event_name, document_type,
+                docx_buffer, pdf_buffer, cc=cc, bcc=bcc
+            )
 
             # Send email
-            with smtplib.SMTP(config['server'], config['port']) as server:
-                server.starttls()
-                server.login(config['username'], config['password'])
+            with EmailSender._open_session(config) as server:
                 server.send_message(msg)
 
             return True, f"Email sent successfully to {to_email}"
 
-        except smtplib.SMTPAuthenticationError:
-            return False, "SMTP authentication failed. Please check username/password."
-        except smtplib.SMTPException as e:
-            return False, f"SMTP error: {str(e)}"
         except Exception as e:
-            return False, f"Failed to send email: {str(e)}"
+            return False, EmailSender._describe_error(e)
 
     @staticmethod
     def send_bulk_emails(
@@ -302,6 +287,9 @@ class EmailSender:
         """
         Send emails to multiple recipients
 
+        Recipients are split across up to BULK_SEND_WORKERS threads, each
+        sending its share over one SMTP session.
+
         Args:
             recipients: List of dicts with keys: email, company_name, event_name, docx_buffer, pdf_buffer
             document_type: "LOR" or "LOA"
@@ -309,27 +297,136 @@ class EmailSender:
         Returns:
             Tuple of (success_count, error_count, error_messages)
         """
+        if not EmailConfig.is_configured():
+            message = "Email is not configured. Please add SMTP settings to secrets.toml"
+            return 0, len(recipients), [f"{r['email']}: {message}" for r in recipients]
+
+        config = EmailConfig.get_smtp_config()
+
+        workers = min(BULK_SEND_WORKERS, len(recipients))
+        if workers == 0:
+            return 0, 0, []
+
+        shards = [recipients[i::workers] for i in range(workers)]
+
         success_count = 0
-        error_count = 0
         errors = []
 
-        for recipient in recipients:
-            success, message = EmailSender.send_document(
-                to_email=recipient['email'],
-                company_name=recipient['company_name'],
-                event_name=recipient['event_name'],
-                document_type=document_type,
-                docx_buffer=recipient['docx_buffer'],
-                pdf_buffer=recipient['pdf_buffer'],
-            )
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for shard_success, shard_errors in executor.map(
+                lambda shard: EmailSender._send_shard(config, shard, document_type), shards
+            ):
+                success_count += shard_success
+                errors.extend(shard_errors)
+
+        return success_count, len(errors), errors
 
-            if success:
-                success_count += 1
-            else:
-                error_count += 1
+    # ========================================================================
+    # PRIVATE HELPER METHODS
+    # ========================================================================
+
+    @staticmethod
+    def _send_shard(config: dict, recipients: List[dict], document_type: str) -> Tuple[int, List[str]]:
+        """
+        Send to a list of recipients over a single SMTP session
+
+        Returns:
+            Tuple of (success_count, error_messages)
+        """
+        success_count = 0
+        errors = []
+
+        try:
+            with EmailSender._open_session(config) as server:
+                for recipient in recipients:
+                    try:
+                        msg = EmailSender._build_message(
+                            config,
+                            to_email=recipient['email'],
+                            company_name=recipient['company_name'],
+                            event_name=recipient['event_name'],
+                            document_type=document_type,
+                            docx_buffer=recipient['docx_buffer'],
+                            pdf_buffer=recipient['pdf_buffer'],
+                        )
+                        server.send_message(msg)
+                        success_count += 1
+                    except smtplib.SMTPServerDisconnected:
+                        raise
+                    except Exception as e:
+                        errors.append(f"{recipient['email']}: {EmailSender._describe_error(e)}")
+
+        except Exception as e:
+            # Session failed (connect/login/disconnect): remaining recipients were not sent
+            message = EmailSender._describe_error(e)
+            for recipient in recipients[success_count + len(errors):]:
                 errors.append(f"{recipient['email']}: {message}")
 
-        return success_count, error_count, errors
+        return success_count, errors
+
+    @staticmethod
+    def _open_session(config: dict) -> smtplib.SMTP:
+        """Open an authenticated SMTP session (use as a context manager)"""
+        server = smtplib.SMTP(config['server'], config['port'])
+        try:
+            server.starttls()
+            server.login(config['username'], config['password'])
+        except Exception:
+            server.close()
+            raise
+        return server
+
+    @staticmethod
+    def _build_message(
+        config: dict,
+        to_email: str,
+        company_name: str,
+        event_name: str,
+        document_type: str,
+        docx_buffer: BytesIO,
+        pdf_buffer: BytesIO,
+        cc: Optional[List[str]] = None,
+        bcc: Optional[List[str]] = None,
+    ) -> EmailMessage:
+        """Build the email (HTML body plus PDF/DOCX attachments) for one recipient"""
+        # Get email template
+        if document_type == "LOA":
+            subject, body_html = EmailTemplates.get_loa_template(company_name, event_name)
+        else:
+            subject, body_html = EmailTemplates.get_lor_template(company_name, event_name)
+
+        # Create message
+        msg = EmailMessage()
+        msg['Subject'] = subject
+        msg['From'] = f"{config['from_name']} <{config['from_email']}>"
+        msg['To'] = to_email
+
+        if cc:
+            msg['Cc'] = ', '.join(cc)
+        if bcc:
+            msg['Bcc'] = ', '.join(bcc)
+
+        # Add HTML body
+        msg.set_content(body_html, subtype='html')
+
+        # Add attachments (encoded straight from the buffer contents)
+        file_stem = f'{document_type}_{company_name.replace(" ", "_")}'
+        msg.add_attachment(pdf_buffer.getvalue(), maintype='application', subtype='pdf',
+                           filename=f'{file_stem}.pdf')
+        msg.add_attachment(docx_buffer.getvalue(), maintype='application',
+                           subtype='vnd.openxmlformats-officedocument.wordprocessingml.document',
+                           filename=f'{file_stem}.docx')
+
+        return msg
+
+    @staticmethod
+    def _describe_error(error: Exception) -> str:
+        """User-facing message for a send failure"""
+        if isinstance(error, smtplib.SMTPAuthenticationError):
+            return "SMTP authentication failed. Please check username/password."
+        if isinstance(error, smtplib.SMTPException):
+            return f"SMTP error: {str(error)}"
+        return f"Failed to send email: {str(error)}"
 
 
 # ============================================================================
@@ -3,11 +3,14 @@ Event Database - Total Health Conferencing
 SQLite database for event calendar management with CSV import/export
 """
 import sqlite3
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List, Optional, Dict
+from typing import Iterable, Iterator, List, Optional, Dict
+from functools import lru_cache
 from datetime import datetime
 import csv
-from io import StringIO, BytesIO
+from io import BytesIO, TextIOBase, TextIOWrapper
 
 from config.events import Event
 
@@ -18,6 +21,9 @@ from config.events import Event
 
 DB_PATH = Path(__file__).parent.parent / "data" / "events.db"
 
+# Booth tier for database events (the table has no tier column)
+DEFAULT_TIER = "standard_1d"
+
 
 # ============================================================================
 # DATABASE SCHEMA
@@ -35,11 +41,77 @@ CREATE TABLE IF NOT EXISTS events (
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
-CREATE INDEX IF NOT EXISTS idx_year ON events(year);
 CREATE INDEX IF NOT EXISTS idx_meeting_name ON events(meeting_name);
+-- Served only a prefix search that nothing uses any more
+DROP INDEX IF EXISTS idx_meeting_name_nocase;
+-- get_all_events(year) filters on year and sorts by date; as the left prefix,
+-- year also serves plain year lookups, so the old idx_year is dropped
+CREATE INDEX IF NOT EXISTS idx_year_date ON events(year, meeting_date_long);
+DROP INDEX IF EXISTS idx_year;
+"""
+
+# Full-text name index kept in sync by triggers. Trigram tokens let MATCH do
+# the same case-insensitive substring search as LIKE '%q%' (3+ characters).
+FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS events_fts USING fts5(
+    meeting_name, content='events', content_rowid='id', tokenize='trigram'
+);
+
+CREATE TRIGGER IF NOT EXISTS events_fts_ai AFTER INSERT ON events BEGIN
+    INSERT INTO events_fts(rowid, meeting_name) VALUES (new.id, new.meeting_name);
+END;
+
+CREATE TRIGGER IF NOT EXISTS events_fts_ad AFTER DELETE ON events BEGIN
+    INSERT INTO events_fts(events_fts, rowid, meeting_name) VALUES ('delete', old.id, old.meeting_name);
+END;
+
+CREATE TRIGGER IF NOT EXISTS events_fts_au AFTER UPDATE OF meeting_name ON events BEGIN
+    INSERT INTO events_fts(events_fts, rowid, meeting_name) VALUES ('delete', old.id, old.meeting_name);
+    INSERT INTO events_fts(rowid, meeting_name) VALUES (new.id, new.meeting_name);
+END;
+"""
+
+# Shortest query the trigram index can match
+FTS_MIN_QUERY_LENGTH = 3
+
+
+# Applied once to each shared connection
+CONNECTION_PRAGMAS = """
+PRAGMA journal_mode=WAL;
+PRAGMA synchronous=NORMAL;
+PRAGMA temp_store=MEMORY;
+PRAGMA mmap_size=268435456;
+PRAGMA cache_size=-65536;
 """
 
 
+@lru_cache(maxsize=None)
+def _conn(db_path: Path) -> sqlite3.Connection:
+    """
+    Shared connection per database file (opened once per process)
+
+    WAL lets Streamlit sessions read while another writes; synchronous=NORMAL
+    drops the per-commit fsync of the WAL. Reads go through a 256MB memory
+    map and a 64MB page cache.
+    """
+    conn = sqlite3.connect(db_path, check_same_thread=False)
+    conn.executescript(CONNECTION_PRAGMAS)
+    conn.row_factory = sqlite3.Row
+    return conn
+
+
+@lru_cache(maxsize=None)
+def _conn_lock(db_path: Path) -> threading.RLock:
+    """Serializes use of the shared connection across Streamlit sessions"""
+    return threading.RLock()
+
+
+@lru_cache(maxsize=None)
+def _read_cache(db_path: Path) -> dict:
+    """Results of hot read queries per database, cleared by every write"""
+    return {}
+
+
 # ============================================================================
 # DATABASE MANAGER
 # ============================================================================
@@ -59,19 +131,41 @@ class EventDatabase:
         """Initialize database connection"""
         self.db_path = db_path
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._cache = _read_cache(self.db_path)
         self._init_database()
 
     def _init_database(self):
         """Create database tables if they don't exist"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._get_connection() as conn:
             conn.executescript(SCHEMA)
+
+            try:
+                has_fts = conn.execute(
+                    "SELECT 1 FROM sqlite_master WHERE name = 'events_fts'"
+                ).fetchone()
+                conn.executescript(FTS_SCHEMA)
+                if not has_fts:
+                    # Index events added before the full-text table existed
+                    conn.execute("INSERT INTO events_fts(events_fts) VALUES ('rebuild')")
+                self._fts = True
+            except sqlite3.OperationalError:
+                # SQLite built without FTS5/trigram: search falls back to LIKE
+                self._fts = False
+
             conn.commit()
 
-    def _get_connection(self) -> sqlite3.Connection:
-        """Get database connection"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        return conn
+    @contextmanager
+    def _get_connection(self) -> Iterator[sqlite3.Connection]:
+        """
+        Use the shared database connection
+
+        Holds the connection's lock for the block, so one session's
+        transaction never interleaves with another's. Commits on success and
+        rolls back on error; the connection itself stays open.
+        """
+        conn = _conn(self.db_path)
+        with _conn_lock(self.db_path), conn:
+            yield conn
 
     # ========================================================================
     # CREATE
@@ -83,7 +177,8 @@ class EventDatabase:
         meeting_date_long: str,
         venue: str,
         city_state: str,
-        year: int
+        year: int,
+        ignore_duplicates: bool = False
     ) -> int:
         """
         Add new event to database
@@ -94,34 +189,78 @@ class EventDatabase:
             venue: Venue name
             city_state: City and state
             year: Event year
+            ignore_duplicates: Return 0 for an existing name instead of raising
 
         Returns:
-            Event ID
+            Event ID (0 if ignore_duplicates and the name already exists)
 
         Raises:
             sqlite3.IntegrityError: If event name already exists
         """
+        verb = "INSERT OR IGNORE" if ignore_duplicates else "INSERT"
+
         with self._get_connection() as conn:
             cursor = conn.execute(
-                """
-                INSERT INTO events (meeting_name, meeting_date_long, venue, city_state, year)
+                f"""
+                {verb} INTO events (meeting_name, meeting_date_long, venue, city_state, year)
                 VALUES (?, ?, ?, ?, ?)
                 """,
                 (meeting_name, meeting_date_long, venue, city_state, year)
             )
             conn.commit()
+
+            if cursor.rowcount == 0:
+                return 0  # Duplicate ignored
+
+            self._cache.clear()
             return cursor.lastrowid
 
-    def add_event_from_object(self, event: Event) -> int:
+    def add_event_from_object(self, event: Event, ignore_duplicates: bool = False) -> int:
         """Add event from Event object"""
         return self.add_event(
             meeting_name=event.meeting_name,
             meeting_date_long=event.meeting_date_long,
             venue=event.venue,
             city_state=event.city_state,
-            year=event.get_year()
+            year=event.get_year(),
+            ignore_duplicates=ignore_duplicates
         )
 
+    def add_events(self, rows: Iterable[tuple], ignore_duplicates: bool = False) -> List[int]:
+        """
+        Add many events in a single transaction
+
+        One commit for the whole batch instead of one per event; if any
+        insert fails, none of the batch is kept.
+
+        Args:
+            rows: (meeting_name, meeting_date_long, venue, city_state, year) tuples
+            ignore_duplicates: Give 0 for existing names instead of raising
+
+        Returns:
+            Event IDs in input order (0 for ignored duplicates)
+
+        Raises:
+            sqlite3.IntegrityError: If an event name already exists
+        """
+        verb = "INSERT OR IGNORE" if ignore_duplicates else "INSERT"
+        sql = f"""
+            {verb} INTO events (meeting_name, meeting_date_long, venue, city_state, year)
+            VALUES (?, ?, ?, ?, ?)
+        """
+        event_ids = []
+
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            for row in rows:
+                cursor.execute(sql, row)
+                event_ids.append(cursor.lastrowid if cursor.rowcount else 0)
+            conn.commit()
+
+        if any(event_ids):
+            self._cache.clear()
+        return event_ids
+
     # ========================================================================
     # READ
     # ========================================================================
@@ -136,6 +275,11 @@ class EventDatabase:
         Returns:
             List of Event objects
         """
+        key = ("events", year)
+        cached = self._cache.get(key)  # One lookup: a write may clear the cache at any time
+        if cached is not None:
+            return list(cached)
+
         with self._get_connection() as conn:
             if year:
                 cursor = conn.execute(
@@ -147,9 +291,10 @@ class EventDatabase:
                     "SELECT * FROM events ORDER BY year DESC, meeting_date_long"
                 )
 
-            rows = cursor.fetchall()
+            # Filled under the lock, so a concurrent write can't leave it stale
+            events = self._cache[key] = [self._row_to_event(row) for row in cursor]
 
-        return [self._row_to_event(row) for row in rows]
+        return list(events)
 
     def get_event_by_id(self, event_id: int) -> Optional[Event]:
         """Get event by ID"""
@@ -178,38 +323,78 @@ class EventDatabase:
         """
         Search events by name (case-insensitive)
 
+        A blank query returns every event; a query that is exactly an event
+        name returns just that event.
+
         Args:
             query: Search query
 
         Returns:
             List of matching Event objects
         """
+        query = query.strip()
+        if not query:
+            return self.get_all_events()
+
         with self._get_connection() as conn:
-            cursor = conn.execute(
-                """
-                SELECT * FROM events
-                WHERE meeting_name LIKE ?
-                ORDER BY meeting_date_long
-                """,
-                (f"%{query}%",)
-            )
+            # Full names are common (picked or pasted): one unique-index probe
+            row = conn.execute(
+                "SELECT * FROM events WHERE meeting_name = ?", (query,)
+            ).fetchone()
+            if row:
+                return [self._row_to_event(row)]
+
+            if not self._fts or len(query) < FTS_MIN_QUERY_LENGTH:
+                pattern = f"%{query}%"
+                cursor = conn.execute(
+                    """
+                    SELECT * FROM events
+                    WHERE meeting_name LIKE ?
+                    ORDER BY meeting_date_long
+                    """,
+                    (pattern,)
+                )
+            else:
+                # Quoted as one phrase; the CTE keeps the planner on the FTS index
+                phrase = '"' + query.replace('"', '""') + '"'
+                cursor = conn.execute(
+                    """
+                    WITH matches AS (
+                        SELECT rowid FROM events_fts WHERE events_fts MATCH ?
+                    )
+                    SELECT events.* FROM events
+                    JOIN matches ON matches.rowid = events.id
+                    ORDER BY meeting_date_long
+                    """,
+                    (phrase,)
+                )
             rows = cursor.fetchall()
 
         return [self._row_to_event(row) for row in rows]
 
     def get_years(self) -> List[int]:
         """Get list of all years with events"""
+        cached = self._cache.get("years")
+        if cached is not None:
+            return list(cached)
+
         with self._get_connection() as conn:
             cursor = conn.execute("SELECT DISTINCT year FROM events ORDER BY year DESC")
-            rows = cursor.fetchall()
+            years = self._cache["years"] = [row['year'] for row in cursor]
 
-        return [row['year'] for row in rows]
+        return list(years)
 
     def count_events(self) -> int:
         """Get total number of events"""
+        count = self._cache.get("count")
+        if count is not None:
+            return count
+
         with self._get_connection() as conn:
             cursor = conn.execute("SELECT COUNT(*) as count FROM events")
-            return cursor.fetchone()['count']
+            count = self._cache["count"] = cursor.fetchone()['count']
+
+        return count
 
     # ========================================================================
     # UPDATE
@@ -253,6 +438,7 @@ class EventDatabase:
                 (meeting_name, meeting_date_long, venue, city_state, year, event_id)
             )
             conn.commit()
+            self._cache.clear()
             return cursor.rowcount > 0
 
     # ========================================================================
@@ -272,6 +458,7 @@ class EventDatabase:
         with self._get_connection() as conn:
             cursor = conn.execute("DELETE FROM events WHERE id = ?", (event_id,))
             conn.commit()
+            self._cache.clear()
             return cursor.rowcount > 0
 
     def delete_events_by_year(self, year: int) -> int:
@@ -287,6 +474,7 @@ class EventDatabase:
         with self._get_connection() as conn:
             cursor = conn.execute("DELETE FROM events WHERE year = ?", (year,))
             conn.commit()
+            self._cache.clear()
             return cursor.rowcount
 
     # ========================================================================
@@ -300,26 +488,20 @@ class EventDatabase:
         Returns:
             BytesIO buffer with CSV data
         """
-        events = self.get_all_events()
+        csv_bytes = BytesIO()
 
-        output = StringIO()
+        # Encode straight into the buffer (no intermediate str copy)
+        output = TextIOWrapper(csv_bytes, encoding='utf-8', newline='')
         writer = csv.writer(output)
 
         # Write header
         writer.writerow(['Meeting Name', 'Date', 'Venue', 'City/State', 'Year'])
 
-        # Write data
-        for event in events:
-            writer.writerow([
-                event.meeting_name,
-                event.meeting_date_long,
-                event.venue,
-                event.city_state,
-                event.get_year()
-            ])
-
-        # Convert to bytes
-        csv_bytes = BytesIO(output.getvalue().encode('utf-8'))
+        # Write data (plain tuples streamed from the cursor)
+        writer.writerows(self._iter_rows())
+
+        output.flush()
+        output.detach()  # Keep csv_bytes open when the wrapper goes away
         csv_bytes.seek(0)
         return csv_bytes
 
@@ -327,63 +509,86 @@ class EventDatabase:
         """
         Import events from CSV file
 
+        Rows are parsed as a stream and inserted with one executemany in a
+        single transaction.
+
         Args:
             csv_file: File object or BytesIO
 
         Returns:
             Tuple of (success_count, error_count, error_messages)
         """
-        success_count = 0
-        error_count = 0
         errors = []
+        wrapped = None  # Our own decoder around a binary upload
 
         try:
-            # Read CSV
-            content = csv_file.read()
-            if isinstance(content, bytes):
-                content = content.decode('utf-8')
-
-            reader = csv.DictReader(StringIO(content))
-
-            for row_num, row in enumerate(reader, start=2):  # Start at 2 (header is 1)
-                try:
-                    # Extract fields (case-insensitive)
-                    row_lower = {k.lower().strip(): v for k, v in row.items()}
-
-                    meeting_name = row_lower.get('meeting name', '').strip()
-                    date = row_lower.get('date', '').strip()
-                    venue = row_lower.get('venue', '').strip()
-                    city_state = row_lower.get('city/state', row_lower.get('city', '')).strip()
-                    year_str = row_lower.get('year', '').strip()
-
-                    # Validate
-                    if not meeting_name or not date or not venue or not city_state or not year_str:
-                        errors.append(f"Row {row_num}: Missing required fields")
-                        error_count += 1
-                        continue
-
-                    year = int(year_str)
-
-                    # Add to database (skip if duplicate)
-                    try:
-                        self.add_event(meeting_name, date, venue, city_state, year)
-                        success_count += 1
-                    except sqlite3.IntegrityError:
-                        errors.append(f"Row {row_num}: Duplicate event '{meeting_name}'")
-                        error_count += 1
-
-                except ValueError as e:
-                    errors.append(f"Row {row_num}: Invalid year value")
-                    error_count += 1
-                except Exception as e:
-                    errors.append(f"Row {row_num}: {str(e)}")
-                    error_count += 1
+            # Read CSV (decode binary uploads on the fly)
+            if isinstance(csv_file, TextIOBase):
+                text = csv_file
+            else:
+                # utf-8-sig drops the BOM Excel writes, which would hide the first header
+                text = wrapped = TextIOWrapper(csv_file, encoding='utf-8-sig', newline='')
+
+            reader = csv.reader(text)
+
+            # Map columns by header name (case-insensitive), once for the file
+            header = [h.lower().strip().lstrip('\ufeff') for h in next(reader, [])]
+            col = {name: i for i, name in enumerate(header)}
+            city_col = col.get('city/state', col.get('city'))
+            columns = (col.get('meeting name'), col.get('date'), col.get('venue'), city_col, col.get('year'))
+
+            with self._get_connection() as conn:
+                seen = {row['meeting_name'] for row in conn.execute("SELECT meeting_name FROM events")}
+
+                def rows():
+                    for row_num, row in enumerate(reader, start=2):  # Start at 2 (header is 1)
+                        meeting_name, date, venue, city_state, year_str = (
+                            row[i].strip() if i is not None and i < len(row) else ''
+                            for i in columns
+                        )
+
+                        # Validate
+                        if not meeting_name or not date or not venue or not city_state or not year_str:
+                            errors.append(f"Row {row_num}: Missing required fields")
+                            continue
+
+                        try:
+                            year = int(year_str)
+                        except ValueError:
+                            errors.append(f"Row {row_num}: Invalid year value")
+                            continue
+
+                        # Skip duplicates (existing or earlier in this file)
+                        if meeting_name in seen:
+                            errors.append(f"Row {row_num}: Duplicate event '{meeting_name}'")
+                            continue
+                        seen.add(meeting_name)
+
+                        yield meeting_name, date, venue, city_state, year
+
+                # One transaction: the 'with' block rolls the whole file back
+                # if reading fails part-way (e.g. a bad byte deep in the upload)
+                cursor = conn.executemany(
+                    """
+                    INSERT OR IGNORE INTO events (meeting_name, meeting_date_long, venue, city_state, year)
+                    VALUES (?, ?, ?, ?, ?)
+                    """,
+                    rows()
+                )
+                conn.commit()
+                self._cache.clear()
+                success_count = cursor.rowcount
 
         except Exception as e:
             errors.append(f"Failed to parse CSV: {str(e)}")
-            error_count += 1
+            return 0, len(errors), errors
 
-        return success_count, error_count, errors
+        finally:
+            # Leave the caller's file open
+            if wrapped is not None:
+                wrapped.detach()
+
+        return success_count, len(errors), errors
 
     # ========================================================================
     # MIGRATION
@@ -393,28 +598,65 @@ class EventDatabase:
         """
         Migrate events from hardcoded list to database
 
+        All events are inserted with one executemany in a single transaction;
+        names already in the database are skipped.
+
         Args:
             events: List of hardcoded Event objects
 
         Returns:
             Tuple of (success_count, duplicate_count)
         """
-        success_count = 0
-        duplicate_count = 0
+        rows = [
+            (e.meeting_name, e.meeting_date_long, e.venue, e.city_state, e.get_year())
+            for e in events
+        ]
 
-        for event in events:
-            try:
-                self.add_event_from_object(event)
-                success_count += 1
-            except sqlite3.IntegrityError:
-                duplicate_count += 1
+        with self._get_connection() as conn:
+            cursor = conn.executemany(
+                """
+                INSERT OR IGNORE INTO events (meeting_name, meeting_date_long, venue, city_state, year)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                rows
+            )
+            conn.commit()
+            self._cache.clear()
+            success_count = cursor.rowcount
 
-        return success_count, duplicate_count
+        return success_count, len(rows) - success_count
 
     # ========================================================================
     # HELPERS
     # ========================================================================
 
+    def _iter_rows(self, year: Optional[int] = None) -> Iterator[tuple]:
+        """
+        Stream event columns as plain tuples, ordered like get_all_events()
+
+        Yields:
+            (meeting_name, meeting_date_long, venue, city_state, year)
+        """
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = None
+            if year:
+                cursor.execute(
+                    """
+                    SELECT meeting_name, meeting_date_long, venue, city_state, year
+                    FROM events WHERE year = ? ORDER BY meeting_date_long
+                    """,
+                    (year,)
+                )
+            else:
+                cursor.execute(
+                    """
+                    SELECT meeting_name, meeting_date_long, venue, city_state, year
+                    FROM events ORDER BY year DESC, meeting_date_long
+                    """
+                )
+            yield from cursor
+
     @staticmethod
     def _row_to_event(row: sqlite3.Row) -> Event:
         """Convert database row to Event object"""
@@ -422,7 +664,10 @@ class EventDatabase:
             meeting_name=row['meeting_name'],
             meeting_date_long=row['meeting_date_long'],
             venue=row['venue'],
-            city_state=row['city_state']
+            city_state=row['city_state'],
+            default_tier=DEFAULT_TIER,
+            id=row['id'],
+            year=row['year']
         )
 
 
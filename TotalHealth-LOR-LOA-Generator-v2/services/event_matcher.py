@@ -2,7 +2,7 @@
 Event Matcher Service - Total Health Conferencing
 Matches event names from Excel spreadsheets to system events
 """
-from typing import Optional, List, Tuple
+from typing import Optional, List, Tuple, Dict
 from config.events import Event, get_all_events
 
 
@@ -16,9 +16,32 @@ class EventMatcher:
     3. Keyword matching (year + location - minimum 3 common words)
     """
 
-    def __init__(self):
-        """Initialize event matcher with all system events"""
-        self.events = get_all_events()
+    def __init__(self, events: Optional[List[Event]] = None):
+        """
+        Initialize event matcher
+
+        System names are lowercased, normalized and split into words once
+        here rather than on every match.
+
+        Args:
+            events: Events to match against (default: all system events)
+        """
+        self.events = get_all_events() if events is None else events
+        self._lower_names = [event.meeting_name.lower() for event in self.events]
+        self._normalized_names = [self._normalize_name(event.meeting_name) for event in self.events]
+        self._name_words = [set(name.split()) for name in self._lower_names]
+
+    @staticmethod
+    def build_index(events: List[Event]) -> Dict[str, Event]:
+        """
+        Map normalized event names to events for O(1) exact lookups
+
+        The first event wins when two names normalize the same.
+        """
+        index = {}
+        for event in events:
+            index.setdefault(EventMatcher._normalize_name(event.meeting_name), event)
+        return index
 
     def match_event(self, event_name: str) -> Optional[Event]:
         """
@@ -115,9 +138,7 @@ class EventMatcher:
         """
         event_name_lower = event_name.lower()
 
-        for event in self.events:
-            system_name_lower = event.meeting_name.lower()
-
+        for event, system_name_lower in zip(self.events, self._lower_names):
             if event_name_lower in system_name_lower or system_name_lower in event_name_lower:
                 return event
 
@@ -134,9 +155,7 @@ class EventMatcher:
         """
         normalized_input = self._normalize_name(event_name)
 
-        for event in self.events:
-            normalized_system = self._normalize_name(event.meeting_name)
-
+        for event, normalized_system in zip(self.events, self._normalized_names):
             if normalized_input in normalized_system or normalized_system in normalized_input:
                 return event
 
@@ -154,9 +173,7 @@ class EventMatcher:
         best_match = None
         max_common = 0
 
-        for event in self.events:
-            system_words = set(event.meeting_name.lower().split())
-
+        for event, system_words in zip(self.events, self._name_words):
             common = input_words & system_words
             common_count = len(common)
 
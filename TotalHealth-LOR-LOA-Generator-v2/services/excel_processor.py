@@ -5,21 +5,84 @@ Handles Excel file parsing, event matching, and batch document generation
 import pandas as pd
 from typing import List, Tuple, Optional, Dict
 from io import BytesIO
+import os
+import multiprocessing
+import threading
 import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
 from pathlib import Path
 
 from core.models import ExcelRow, DocumentPayload
 from services.event_matcher import EventMatcher, get_all_events
-from generators.lor_generator import generate_lor_documents
-from generators.loa_generator import generate_loa_documents
-from config.pricing import calculate_pricing_for_event
-from config.settings import DEFAULT_AUDIENCE
+from generators.lor_generator import generate_lor
+from generators.loa_generator import generate_loa
+from config.settings import DEFAULT_AUDIENCE, AUTHORIZED_SIGNATORIES
+
+
+# Worker processes for bulk generation (DOCX/PDF rendering is CPU-bound)
+BATCH_WORKERS = min(4, os.cpu_count() or 1)
+
+_batch_pool: Optional[ProcessPoolExecutor] = None
+_batch_pool_lock = threading.Lock()
+
+
+def _get_batch_pool() -> ProcessPoolExecutor:
+    """
+    Worker pool for bulk generation, created on first use and then reused
+
+    Workers are spawned rather than forked: forking the multi-threaded
+    Streamlit server can copy locks held by other threads into the child.
+    """
+    global _batch_pool
+    with _batch_pool_lock:
+        if _batch_pool is None:
+            _batch_pool = ProcessPoolExecutor(
+                max_workers=BATCH_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _batch_pool
+
+
+def _discard_batch_pool(pool: ProcessPoolExecutor):
+    """Drop a broken pool so the next batch starts a fresh one"""
+    global _batch_pool
+    with _batch_pool_lock:
+        if _batch_pool is pool:
+            _batch_pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
 
 
 # ============================================================================
 # EXCEL PARSING
 # ============================================================================
 
+# Column types _parse_frame keeps as-is (text is stripped, numbers unchanged)
+_PLAIN_CELL_TYPES = {
+    'empty', 'string', 'integer', 'floating', 'mixed-integer-float', 'decimal', 'boolean',
+}
+
+
+def _cell_value(val):
+    """Numbers as-is, anything else as text (mirrors _parse_row's get_value)"""
+    return val if isinstance(val, (int, float)) else str(val)
+
+
+def read_excel(file_obj) -> pd.DataFrame:
+    """
+    Read the first sheet of an .xlsx file
+
+    Uses the Rust-based calamine reader when python-calamine is installed,
+    otherwise openpyxl.
+    """
+    try:
+        return pd.read_excel(file_obj, engine='calamine')
+    except ImportError:
+        file_obj.seek(0)
+        return pd.read_excel(file_obj, engine='openpyxl')
+
+
 class ExcelProcessor:
     """
     Processes Excel files for bulk document generation
@@ -64,7 +127,7 @@ class ExcelProcessor:
 
         try:
             # Read Excel file
-            df = pd.read_excel(file_obj, engine='openpyxl')
+            df = read_excel(file_obj)
 
             # Normalize column names (lowercase, strip whitespace)
             df.columns = df.columns.str.lower().str.strip()
@@ -80,13 +143,8 @@ class ExcelProcessor:
                 errors.append(f"Missing required columns: {', '.join(missing)}")
                 return rows, errors
 
-            # Process each row
-            for idx, row in df.iterrows():
-                try:
-                    excel_row = ExcelProcessor._parse_row(row, column_map, idx + 2)  # +2 for Excel row number
-                    rows.append(excel_row)
-                except Exception as e:
-                    errors.append(f"Row {idx + 2}: {str(e)}")
+            # Process all rows with column operations
+            rows = ExcelProcessor._parse_frame(df, column_map)
 
             return rows, errors
 
@@ -98,26 +156,103 @@ class ExcelProcessor:
     def _build_column_map(columns: pd.Index) -> Dict[str, str]:
         """Build mapping from Excel columns to expected field names"""
         column_map = {}
+        fields_for = _COLUMN_FIELDS.get
 
-        for field, variations in ExcelProcessor.COLUMN_MAPPINGS.items():
-            for col in columns:
-                if col in variations:
-                    column_map[field] = col
-                    break
+        # One pass over the columns; the first matching column wins per field
+        for col in columns:
+            for field in fields_for(col, ()):
+                column_map.setdefault(field, col)
 
         return column_map
 
     @staticmethod
-    def _parse_row(row: pd.Series, column_map: Dict[str, str], row_number: int) -> ExcelRow:
-        """Parse a single Excel row into ExcelRow object"""
+    def _parse_frame(df: pd.DataFrame, column_map: Dict[str, str]) -> List[ExcelRow]:
+        """
+        Parse every row of the sheet at once
+
+        Gives the same values and validation as _parse_row: blank cells become
+        None (or the required-field defaults), text is stripped and numbers
+        are kept as they are.
+        """
+        fields = pd.DataFrame(
+            {field: df[col] for field, col in column_map.items()},
+            index=df.index,
+        ).reindex(columns=list(ExcelProcessor.COLUMN_MAPPINGS)).astype(object)
+
+        for field in fields.columns:
+            col = fields[field]
+
+            # Other cell types (e.g. dates) are read as text, like _parse_row
+            if pd.api.types.infer_dtype(col, skipna=True) not in _PLAIN_CELL_TYPES:
+                col = col.map(_cell_value, na_action='ignore')
+
+            try:
+                stripped = col.str.strip()  # NaN for non-text cells
+            except AttributeError:
+                stripped = col  # No text in this column
+            fields[field] = stripped.where(stripped.notna(), col)
+
+        # (back to object first: pandas string columns can't hold None)
+        fields = fields.astype(object)
+        fields = fields.where(fields.notna(), None)
+
+        # Required fields and their validation
+        raw_total = fields['total']
+        exhibitor = fields['exhibitor_invite'].fillna('')
+        event = fields['event_name'].fillna('')
+        total = raw_total.fillna('0').astype(str)
+
+        missing_company = exhibitor.eq('')
+        missing_event = event.eq('')
+        missing_total = total.isin(['', '0']) | raw_total.eq(0)
+
+        records = fields.assign(
+            exhibitor_invite=exhibitor,
+            event_name=event,
+            total=total,
+            company_name=fields['exhibitor_invite'],  # Same as exhibitor
+        ).to_dict('records')
+
+        rows = []
+        for row_number, record, no_company, no_event, no_total in zip(
+            range(2, len(records) + 2),  # +2 for Excel row number
+            records,
+            missing_company, missing_event, missing_total,
+        ):
+            excel_row = ExcelRow(**record, row_number=row_number)
+
+            if no_company:
+                excel_row.add_error("Missing company name")
+            if no_event:
+                excel_row.add_error("Missing event name")
+            if no_total:
+                excel_row.add_error("Missing or invalid total")
+
+            rows.append(excel_row)
+
+        return rows
+
+    @staticmethod
+    def _parse_row(row, column_map: Dict[str, str], row_number: int) -> ExcelRow:
+        """
+        Parse a single Excel row into ExcelRow object
+
+        Args:
+            row: Plain dict of column -> cell (a pandas Series also works)
+            column_map: Field name -> column name
+            row_number: Excel row number for messages
+        """
+
+        column_for = column_map.get
+        cell = row.get
 
         def get_value(field: str, default=None):
             """Safely get value from row"""
-            col = column_map.get(field)
+            col = column_for(field)
             if col is None:
                 return default
-            val = row.get(col)
-            if pd.isna(val):
+            val = cell(col)
+            if val is None or val != val:  # Blank cell (None, NaN or NaT)
                 return default
             return str(val).strip() if not isinstance(val, (int, float)) else val
 
@@ -165,13 +300,20 @@ class ExcelProcessor:
         """
         all_events = get_all_events()
 
+        # Built once per upload: exact lookups first, fuzzy matching on a miss
+        index = EventMatcher.build_index(all_events)
+        matcher = EventMatcher(all_events)
+
         for row in rows:
             if not row.event_name:
                 row.add_error("No event name provided")
                 continue
 
             # Try to match event
-            matched = EventMatcher.find_best_match(row.event_name, all_events)
+            matched = (
+                index.get(EventMatcher._normalize_name(row.event_name))
+                or matcher.match_event(row.event_name)
+            )
 
             if matched:
                 row.matched_event = {
@@ -203,74 +345,116 @@ class ExcelProcessor:
         Returns:
             Tuple of (zip_buffer, success_count, error_count)
         """
-        from config.settings import AUTHORIZED_SIGNATORIES
-
-        # Create in-memory ZIP file
-        zip_buffer = BytesIO()
+        # Same signatory for the whole batch
+        signatory_info = AUTHORIZED_SIGNATORIES.get(signatory_key, AUTHORIZED_SIGNATORIES["sarah"])
+        signature_person = (
+            f"{signatory_info['name']} - {signatory_info['title']}" if document_type == "LOA" else None
+        )
 
         success_count = 0
         error_count = 0
 
-        with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            for row in rows:
-                # Skip rows with errors
-                if row.has_errors():
-                    error_count += 1
-                    continue
-
-                if not row.matched_event:
-                    error_count += 1
-                    continue
-
-                try:
-                    # Build payload
-                    signatory_info = AUTHORIZED_SIGNATORIES.get(signatory_key, AUTHORIZED_SIGNATORIES["sarah"])
-                    signature_person = f"{signatory_info['name']} - {signatory_info['title']}"
-
-                    payload = DocumentPayload(
-                        company_name=row.company_name or row.exhibitor_invite,
-                        company_address=row.official_address or "",
-                        meeting_name=row.matched_event['meeting_name'],
-                        meeting_date_long=row.matched_event['meeting_date_long'],
-                        venue=row.matched_event['venue'],
-                        city_state=row.matched_event['city_state'],
-                        final_total=row.get_total_amount(),
-                        amount_currency=row.total,
-                        document_type=document_type,
-                        signature_person=signature_person if document_type == "LOA" else None,
-                        attendance_expected=row.expected_attendance,
-                        audience_list=DEFAULT_AUDIENCE,
-                        event_year=row.matched_event.get('event_year', 2025),
-                    )
-
-                    # Generate documents
-                    if document_type == "LOA":
-                        docx_buffer, pdf_buffer = generate_loa_documents(
-                            payload,
-                            signatory_key=signatory_key
-                        )
-                    else:
-                        docx_buffer, pdf_buffer = generate_lor_documents(payload)
-
-                    # Add to ZIP with unique filenames
-                    company_slug = row.company_name.replace(' ', '_').replace('/', '_')[:50]
-                    event_slug = row.matched_event['meeting_name'][:30].replace(' ', '_').replace('/', '_')
-
-                    base_name = f"{document_type}_{company_slug}_{event_slug}"
-
-                    zipf.writestr(f"{base_name}.docx", docx_buffer.getvalue())
-                    zipf.writestr(f"{base_name}.pdf", pdf_buffer.getvalue())
+        # Build payloads here; render them in worker processes
+        jobs = []
+        for row in rows:
+            # Skip rows with errors
+            if row.has_errors():
+                error_count += 1
+                continue
+
+            if not row.matched_event:
+                error_count += 1
+                continue
 
-                    success_count += 1
+            try:
+                # Build payload
+                payload = DocumentPayload(
+                    company_name=row.company_name or row.exhibitor_invite,
+                    company_address=row.official_address or "",
+                    meeting_name=row.matched_event['meeting_name'],
+                    meeting_date_long=row.matched_event['meeting_date_long'],
+                    venue=row.matched_event['venue'],
+                    city_state=row.matched_event['city_state'],
+                    final_total=row.get_total_amount(),
+                    amount_currency=row.total,
+                    document_type=document_type,
+                    signature_person=signature_person,
+                    attendance_expected=row.expected_attendance,
+                    audience_list=DEFAULT_AUDIENCE,
+                    event_year=row.matched_event.get('event_year', 2025),
+                )
+
+                # Unique filenames within the ZIP
+                company_slug = row.company_name.replace(' ', '_').replace('/', '_')[:50]
+                event_slug = row.matched_event['meeting_name'][:30].replace(' ', '_').replace('/', '_')
+
+                base_name = f"{document_type}_{company_slug}_{event_slug}"
+
+                jobs.append((row, base_name, payload.to_dict()))
+
+            except Exception as e:
+                row.add_error(f"Generation failed: {str(e)}")
+                error_count += 1
+
+        # Create in-memory ZIP file (stored: DOCX is already a ZIP and PDF
+        # streams are already compressed, so deflate would gain little)
+        zip_buffer = BytesIO()
 
-                except Exception as e:
-                    row.add_error(f"Generation failed: {str(e)}")
-                    error_count += 1
+        with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_STORED) as zipf:
+            if jobs:
+                pool = _get_batch_pool()
+                futures = [
+                    pool.submit(_generate_documents, payload, document_type)
+                    for _, _, payload in jobs
+                ]
+
+                # Written in row order as results arrive (ZipFile stays in this process)
+                for (row, base_name, _), future in zip(jobs, futures):
+                    try:
+                        docx_bytes, pdf_bytes = future.result()
+                    except BrokenProcessPool as e:
+                        _discard_batch_pool(pool)
+                        row.add_error(f"Generation failed: {str(e)}")
+                        error_count += 1
+                        continue
+                    except Exception as e:
+                        row.add_error(f"Generation failed: {str(e)}")
+                        error_count += 1
+                        continue
+
+                    zipf.writestr(f"{base_name}.docx", docx_bytes)
+                    zipf.writestr(f"{base_name}.pdf", pdf_bytes)
+
+                    success_count += 1
 
         zip_buffer.seek(0)
         return zip_buffer, success_count, error_count
 
 
+# Column name -> fields it can fill (a name like 'location' fills several)
+_COLUMN_FIELDS: Dict[str, Tuple[str, ...]] = {}
+for _field, _variations in ExcelProcessor.COLUMN_MAPPINGS.items():
+    for _variation in _variations:
+        _COLUMN_FIELDS[_variation] = _COLUMN_FIELDS.get(_variation, ()) + (_field,)
+
+
+def _generate_documents(payload: Dict, document_type: str) -> Tuple[bytes, bytes]:
+    """
+    Render one row's documents (runs in a worker process)
+
+    The LOA signature is looked up from payload['signature_person'].
+
+    Returns:
+        Tuple of (docx_bytes, pdf_bytes)
+    """
+    if document_type == "LOA":
+        docx_buffer, pdf_buffer = generate_loa(payload)
+    else:
+        docx_buffer, pdf_buffer = generate_lor(payload)
+
+    return docx_buffer.getvalue(), pdf_buffer.getvalue()
+
+
 # ============================================================================
 # TEMPLATE GENERATION
 # ============================================================================
@@ -282,6 +466,12 @@ def create_excel_template() -> BytesIO:
     Returns:
         BytesIO object containing Excel template
     """
+    return BytesIO(_excel_template_bytes())
+
+
+@lru_cache(maxsize=1)
+def _excel_template_bytes() -> bytes:
+    """Build the (constant) template workbook once per process"""
     # Create sample data
     data = {
         'Exhibitor Invite': [
@@ -318,8 +508,7 @@ def create_excel_template() -> BytesIO:
     with pd.ExcelWriter(buffer, engine='openpyxl') as writer:
         df.to_excel(writer, index=False, sheet_name='Letters')
 
-    buffer.seek(0)
-    return buffer
+    return buffer.getvalue()
 
 
 # ============================================================================
@@ -336,30 +525,32 @@ def generate_validation_report(rows: List[ExcelRow]) -> str:
     Returns:
         Formatted validation report
     """
-    report_lines = ["# Validation Report\n"]
-
-    total_rows = len(rows)
-    valid_rows = [r for r in rows if not r.has_errors()]
-    error_rows = [r for r in rows if r.has_errors()]
-
-    report_lines.append(f"**Total Rows**: {total_rows}")
-    report_lines.append(f"**Valid Rows**: {len(valid_rows)}")
-    report_lines.append(f"**Rows with Errors**: {len(error_rows)}\n")
-
-    if error_rows:
-        report_lines.append("## Errors\n")
-        for row in error_rows:
-            report_lines.append(f"**Row {row.row_number}**: {row.company_name or row.exhibitor_invite}")
-            for error in row.errors:
-                report_lines.append(f"  - {error}")
-            report_lines.append("")
-
-    if valid_rows:
-        report_lines.append("## Valid Rows (Ready to Generate)\n")
-        for row in valid_rows[:10]:  # Show first 10
-            report_lines.append(f"- **{row.company_name}** → {row.matched_event['meeting_name'] if row.matched_event else 'No match'}")
-
-        if len(valid_rows) > 10:
-            report_lines.append(f"\n... and {len(valid_rows) - 10} more")
-
-    return "\n".join(report_lines)
+    # Partition in one pass
+    valid_rows, error_rows = [], []
+    for row in rows:
+        (error_rows if row.has_errors() else valid_rows).append(row)
+
+    def report_lines():
+        yield "# Validation Report\n"
+
+        yield f"**Total Rows**: {len(rows)}"
+        yield f"**Valid Rows**: {len(valid_rows)}"
+        yield f"**Rows with Errors**: {len(error_rows)}\n"
+
+        if error_rows:
+            yield "## Errors\n"
+            for row in error_rows:
+                yield f"**Row {row.row_number}**: {row.company_name or row.exhibitor_invite}"
+                for error in row.errors:
+                    yield f"  - {error}"
+                yield ""
+
+        if valid_rows:
+            yield "## Valid Rows (Ready to Generate)\n"
+            for row in valid_rows[:10]:  # Show first 10
+                yield f"- **{row.company_name}** → {row.matched_event['meeting_name'] if row.matched_event else 'No match'}"
+
+            if len(valid_rows) > 10:
+                yield f"\n... and {len(valid_rows) - 10} more"
+
+    return "\n".join(report_lines())
@@ -96,10 +96,7 @@ class MultiMeetingService:
         else:
             generator = LORGenerator(payload)
 
-        docx_buffer = generator.generate_docx()
-        pdf_buffer = generator.generate_pdf()
-
-        return docx_buffer, pdf_buffer
+        return generator.generate_documents()
 
     @staticmethod
     def _create_package_payload(package: MultiMeetingPackage) -> Dict:
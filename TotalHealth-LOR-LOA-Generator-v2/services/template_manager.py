@@ -5,8 +5,18 @@ Manages document templates for LOA/LOR generation with variable substitution
 from pathlib import Path
 from typing import Dict, List, Optional
 import json
+import os
+from operator import itemgetter
+import re
+import tempfile
+import threading
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # Optional speedup; stdlib json is the fallback
+    orjson = None
+
 
 # ============================================================================
 # TEMPLATE STORAGE
@@ -15,6 +25,46 @@ from datetime import datetime
 TEMPLATES_DIR = Path(__file__).parent.parent / "data" / "templates"
 TEMPLATES_DIR.mkdir(parents=True, exist_ok=True)
 
+# Manifest of template metadata, so listings never open every template file
+INDEX_FILE = "_index.json"
+INDEX_FIELDS = ('name', 'document_type', 'is_default')
+
+# Template variables, e.g. {company_name}
+_VAR_PATTERN = re.compile(r'\{(\w+)\}')
+
+
+def _loads(data: bytes) -> Dict:
+    """Parse template JSON (orjson when installed)"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(obj: Dict) -> bytes:
+    """Serialize template JSON as compact UTF-8 bytes (orjson when installed)"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def _write_atomic(file_path: Path, data: bytes):
+    """
+    Write a file via a temp file and rename, so readers never see a partial file
+
+    Each write gets its own uniquely named temp file, so concurrent writers
+    never overwrite each other's half-written data.
+    """
+    with tempfile.NamedTemporaryFile(
+        dir=file_path.parent, prefix=file_path.name + ".", suffix=".tmp", delete=False
+    ) as tmp:
+        tmp.write(data)
+
+    try:
+        os.replace(tmp.name, file_path)
+    except OSError:
+        os.unlink(tmp.name)
+        raise
+
 
 # ============================================================================
 # DEFAULT TEMPLATES
@@ -79,6 +129,13 @@ class DocumentTemplate:
     - Version tracking
     """
 
+    # Serialized fields, in to_dict() order
+    _FIELDS = (
+        'template_id', 'name', 'document_type', 'content', 'variables',
+        'description', 'version', 'created_at', 'is_default',
+    )
+    __slots__ = _FIELDS + ('_compiled',)
+
     def __init__(
         self,
         template_id: str,
@@ -100,38 +157,49 @@ class DocumentTemplate:
         self.version = version
         self.created_at = created_at or datetime.now().isoformat()
         self.is_default = is_default
+        self._compiled = None  # (content, literals, names) from the last compile
 
     def render(self, context: Dict[str, str]) -> str:
         """
         Render template with context variables
 
+        Substitutes in one pass, so values containing {braces} are left as
+        they are. Variables missing from context stay as placeholders.
+
         Args:
             context: Dictionary of variable values
 
         Returns:
             Rendered template string
         """
-        rendered = self.content
+        literals, names = self._compile()
+
+        parts = [literals[0]]
+        for name, literal in zip(names, literals[1:]):
+            parts.append(str(context[name]) if name in context else f"{{{name}}}")
+            parts.append(literal)
 
-        for key, value in context.items():
-            placeholder = f"{{{key}}}"
-            rendered = rendered.replace(placeholder, str(value))
+        return ''.join(parts)
+
+    def _compile(self):
+        """
+        Split content into literal text and variable names
+
+        Done once per content (batch mode renders the same template per row),
+        so rendering needs no regex work.
+
+        Returns:
+            Tuple of (literals, names); literals has one more item than names
+        """
+        if self._compiled is None or self._compiled[0] is not self.content:
+            parts = _VAR_PATTERN.split(self.content)
+            self._compiled = (self.content, tuple(parts[0::2]), tuple(parts[1::2]))
 
-        return rendered
+        return self._compiled[1], self._compiled[2]
 
     def to_dict(self) -> Dict:
         """Convert to dictionary for JSON serialization"""
-        return {
-            'template_id': self.template_id,
-            'name': self.name,
-            'document_type': self.document_type,
-            'content': self.content,
-            'variables': self.variables,
-            'description': self.description,
-            'version': self.version,
-            'created_at': self.created_at,
-            'is_default': self.is_default,
-        }
+        return {field: getattr(self, field) for field in self._FIELDS}
 
     @classmethod
     def from_dict(cls, data: Dict) -> 'DocumentTemplate':
@@ -157,12 +225,60 @@ class TemplateManager:
     def __init__(self, templates_dir: Path = TEMPLATES_DIR):
         self.templates_dir = templates_dir
         self.templates_dir.mkdir(parents=True, exist_ok=True)
-        self._ensure_defaults()
+        self._cache: Dict[str, DocumentTemplate] = {}  # template_id -> loaded template
+        self._index_path = self.templates_dir / INDEX_FILE
+        self._lock = threading.Lock()  # Guards the manifest and file writes (the manager is shared)
+        self._index = self._load_index()  # template_id -> {name, document_type, is_default}
+
+        # Defaults live in memory; a saved file of the same ID overrides them
+        self._builtin = self._builtin_defaults()
+        self._builtin_index = {
+            template_id: {field: getattr(template, field) for field in INDEX_FIELDS}
+            for template_id, template in self._builtin.items()
+        }
 
-    def _ensure_defaults(self):
-        """Ensure default templates exist"""
-        if not self.get_template("default_lor"):
-            self.save_template(DocumentTemplate(
+    def _load_index(self) -> Dict[str, Dict]:
+        """
+        Load the template manifest, rebuilding it from the template files
+        if it is missing or unreadable
+
+        Returns:
+            Dictionary of template_id -> metadata
+        """
+        if self._index_path.exists():
+            try:
+                return _loads(self._index_path.read_bytes())
+            except Exception:
+                pass
+
+        index = {}
+        with os.scandir(self.templates_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".json") or entry.name == INDEX_FILE or not entry.is_file():
+                    continue
+
+                template_id = entry.name[:-5]
+                try:
+                    template = self._cache[template_id] = DocumentTemplate.from_dict(
+                        _loads(Path(entry.path).read_bytes())
+                    )
+                except Exception:
+                    continue
+
+                index[template_id] = {field: getattr(template, field) for field in INDEX_FIELDS}
+
+        _write_atomic(self._index_path, _dumps(index))
+        return index
+
+    def _save_index(self):
+        """Persist the template manifest (call with self._lock held)"""
+        _write_atomic(self._index_path, _dumps(self._index))
+
+    @staticmethod
+    def _builtin_defaults() -> Dict[str, DocumentTemplate]:
+        """Default templates, built in memory from the module constants"""
+        return {
+            "default_lor": DocumentTemplate(
                 template_id="default_lor",
                 name="Default LOR",
                 document_type="LOR",
@@ -174,10 +290,8 @@ class TemplateManager:
                 ],
                 description="Standard Letter of Recognition template",
                 is_default=True
-            ))
-
-        if not self.get_template("default_loa"):
-            self.save_template(DocumentTemplate(
+            ),
+            "default_loa": DocumentTemplate(
                 template_id="default_loa",
                 name="Default LOA",
                 document_type="LOA",
@@ -190,26 +304,58 @@ class TemplateManager:
                 ],
                 description="Standard Letter of Agreement template",
                 is_default=True
-            ))
+            ),
+        }
 
     def save_template(self, template: DocumentTemplate):
-        """Save template to file"""
+        """Save template to file (replaced atomically, so readers never see a partial file)"""
         file_path = self.templates_dir / f"{template.template_id}.json"
 
-        with open(file_path, 'w') as f:
-            json.dump(template.to_dict(), f, indent=2)
+        with self._lock:
+            _write_atomic(file_path, _dumps(template.to_dict()))
+
+            self._cache[template.template_id] = template
+            self._index[template.template_id] = {field: getattr(template, field) for field in INDEX_FIELDS}
+            self._save_index()
 
     def get_template(self, template_id: str) -> Optional[DocumentTemplate]:
-        """Get template by ID"""
+        """Get template by ID (read from disk once, then cached; defaults need no file)"""
+        if template_id in self._cache:
+            return self._cache[template_id]
+
         file_path = self.templates_dir / f"{template_id}.json"
 
         if not file_path.exists():
-            return None
+            return self._builtin.get(template_id)
+
+        data = _loads(file_path.read_bytes())
 
-        with open(file_path, 'r') as f:
-            data = json.load(f)
+        template = self._cache[template_id] = DocumentTemplate.from_dict(data)
+        return template
 
-        return DocumentTemplate.from_dict(data)
+    def list_template_metadata(self, document_type: Optional[str] = None) -> List[Dict]:
+        """
+        List template metadata from the manifest, without opening any template file
+
+        Args:
+            document_type: Filter by "LOR" or "LOA" (None = all)
+
+        Returns:
+            List of dicts with template_id, name, document_type and is_default,
+            defaults first, then by name
+        """
+        with self._lock:
+            index = {**self._builtin_index, **self._index}
+
+        # Sort keys are built once per template, not by a lambda per element
+        keyed = [
+            ((not meta['is_default'], meta['name']), {'template_id': template_id, **meta})
+            for template_id, meta in index.items()
+            if document_type is None or meta['document_type'] == document_type
+        ]
+        keyed.sort(key=itemgetter(0))
+
+        return [meta for _, meta in keyed]
 
     def list_templates(self, document_type: Optional[str] = None) -> List[DocumentTemplate]:
         """
@@ -223,20 +369,16 @@ class TemplateManager:
         """
         templates = []
 
-        for file_path in self.templates_dir.glob("*.json"):
+        for meta in self.list_template_metadata(document_type):
             try:
-                with open(file_path, 'r') as f:
-                    data = json.load(f)
-
-                template = DocumentTemplate.from_dict(data)
-
-                if document_type is None or template.document_type == document_type:
-                    templates.append(template)
-
+                template = self.get_template(meta['template_id'])
             except Exception:
                 continue
 
-        return sorted(templates, key=lambda t: (not t.is_default, t.name))
+            if template is not None:
+                templates.append(template)
+
+        return templates
 
     def delete_template(self, template_id: str) -> bool:
         """
@@ -252,7 +394,12 @@ class TemplateManager:
 
         if template and not template.is_default:
             file_path = self.templates_dir / f"{template_id}.json"
-            file_path.unlink()
+
+            with self._lock:
+                file_path.unlink(missing_ok=True)
+                self._cache.pop(template_id, None)
+                self._index.pop(template_id, None)
+                self._save_index()
             return True
 
         return False
@@ -289,16 +436,15 @@ class TemplateManager:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         template_id = f"{template_id}_{timestamp}"
 
-        # Extract variables from content
-        import re
-        variables = re.findall(r'\{(\w+)\}', content)
+        # Extract variables from content (deduplicated, first-use order)
+        variables = list(dict.fromkeys(_VAR_PATTERN.findall(content)))
 
         template = DocumentTemplate(
             template_id=template_id,
             name=name,
             document_type=document_type,
             content=content,
-            variables=list(set(variables)),
+            variables=variables,
             description=description,
             version="1.0"
         )
@@ -312,13 +458,21 @@ class TemplateManager:
 # ============================================================================
 
 _manager_instance = None
+_manager_lock = threading.Lock()
 
 
 def get_template_manager() -> TemplateManager:
-    """Get singleton template manager instance"""
+    """
+    Get singleton template manager instance
+
+    Created under a lock, so concurrent first requests build (and seed
+    defaults) only once.
+    """
     global _manager_instance
     if _manager_instance is None:
-        _manager_instance = TemplateManager()
+        with _manager_lock:
+            if _manager_instance is None:
+                _manager_instance = TemplateManager()
     return _manager_instance
 
 
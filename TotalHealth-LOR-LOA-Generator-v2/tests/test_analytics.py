@@ -0,0 +1,95 @@
+"""
+Tests for Analytics - Total Health Conferencing
+Tests the activity log aggregation behind the analytics dashboard
+"""
+import pytest
+import json
+from collections import Counter
+
+from services.analytics import empty_aggregates, fold_entry, summarize, update_aggregates
+
+
+def make_entry(company: str, event: str, cost: float = 10.0, **extra) -> dict:
+    """Log entry as written by the audit logger"""
+    return {'company_name': company, 'meeting_name': event, 'total_cost': cost, **extra}
+
+
+class TestFoldEntry:
+    """Test folding log entries into the aggregates"""
+
+    def test_company_across_events_is_one_row(self):
+        """Test one company's entries for several events count under one key"""
+        agg = empty_aggregates(0)
+        companies = set()
+        for event, cost in (("ASCO 2026", 10.0), ("ASCO 2026", 10.0), ("ESMO 2026", 10.0), ("ASCO 2026", 10.0)):
+            fold_entry(agg, companies, {
+                'company_name': 'Acme', 'meeting_name': event, 'total_cost': cost
+            })
+
+        assert agg['company_activity'] == {'acme': {'name': 'Acme', 'count': 4, 'revenue': 40.0}}
+        assert agg['event_counts'] == Counter({"ASCO 2026": 3, "ESMO 2026": 1})
+        assert companies == {'acme'}
+
+    def test_company_spellings_share_a_row(self):
+        """Test case and spacing variants fold into the first spelling seen"""
+        agg = empty_aggregates(0)
+        companies = set()
+        fold_entry(agg, companies, make_entry('Acme Pharma', 'ASCO 2026'))
+        fold_entry(agg, companies, make_entry(' ACME PHARMA', 'ESMO 2026', company_key='acme pharma'))
+
+        assert agg['company_activity'] == {'acme pharma': {'name': 'Acme Pharma', 'count': 2, 'revenue': 20.0}}
+
+    def test_tallies(self):
+        """Test per-key tallies, skipping entries without a booth"""
+        agg = empty_aggregates(0)
+        companies = set()
+        fold_entry(agg, companies, make_entry('Acme', 'ASCO 2026', 30.0, document_type='LOA',
+                                              booth_selected='tier_1', add_ons=['wifi', 'lunch']))
+        fold_entry(agg, companies, make_entry('Beta', 'ASCO 2026', 5.0, document_type='LOR',
+                                              booth_selected='None', add_ons=['wifi']))
+
+        assert agg['doc_types'] == Counter({'LOA': 1, 'LOR': 1})
+        assert agg['booth_counts'] == Counter({'tier_1': 1})
+        assert agg['booth_revenue'] == Counter({'tier_1': 30.0})
+        assert agg['addon_counts'] == Counter({'wifi': 2, 'lunch': 1})
+        assert agg['event_revenue'] == Counter({'ASCO 2026': 35.0})
+
+
+class TestSummarize:
+    """Test the page summary built from the aggregates"""
+
+    def test_top_companies_one_row_per_company(self):
+        """Test a company with entries for several events is listed once"""
+        agg = empty_aggregates(0)
+        companies = set()
+        for event in ('ASCO 2026', 'ASCO 2026', 'ESMO 2026'):
+            fold_entry(agg, companies, make_entry('Acme', event))
+        fold_entry(agg, companies, make_entry('Beta', 'ESMO 2026'))
+        agg['companies'] = sorted(companies)
+
+        summary = summarize(agg)
+
+        assert summary.top_companies == [('Acme', 3, 30.0, 10.0), ('Beta', 1, 10.0, 10.0)]
+        assert summary.unique_companies == 2
+        assert summary.total_documents == 4
+
+    def test_update_aggregates_folds_new_lines_only(self, tmp_path):
+        """Test later calls only read lines appended since the last one"""
+        log_file = tmp_path / "log.jsonl"
+        cache_file = tmp_path / "analytics_cache.json"
+        log_file.write_text(json.dumps(make_entry('Acme', 'ASCO 2026')) + "\n")
+
+        agg = update_aggregates(log_file, cache_file, log_file.stat().st_size)
+        assert agg['total_documents'] == 1
+
+        with open(log_file, 'a') as f:
+            f.write(json.dumps(make_entry('Acme', 'ESMO 2026')) + "\n")
+        agg = update_aggregates(log_file, cache_file, log_file.stat().st_size)
+
+        assert agg['total_documents'] == 2
+        assert agg['offset'] == log_file.stat().st_size
+        assert summarize(agg).top_companies == [('Acme', 2, 20.0, 10.0)]
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,126 @@
+"""
+Tests for Email Service - Total Health Conferencing
+Tests message building and bulk sending against a fake SMTP server
+"""
+import pytest
+import smtplib
+from io import BytesIO
+
+import services.email_service as email_service
+from services.email_service import EmailSender, EmailConfig, EmailTemplates
+
+
+SMTP_CONFIG = {
+    'server': 'smtp.example.com',
+    'port': 587,
+    'username': 'user',
+    'password': 'secret',
+    'from_email': 'sender@example.com',
+    'from_name': 'Total Health Conferencing',
+}
+
+
+class FakeSMTP:
+    """Records sessions and sent messages instead of talking to a server"""
+
+    sessions = []
+
+    def __init__(self, server, port):
+        self.sent = []
+        self.logins = 0
+        FakeSMTP.sessions.append(self)
+
+    def starttls(self):
+        pass
+
+    def login(self, username, password):
+        self.logins += 1
+
+    def send_message(self, msg):
+        if msg['To'].startswith('reject'):
+            raise smtplib.SMTPRecipientsRefused({msg['To']: (550, b'No such user')})
+        self.sent.append(msg)
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+@pytest.fixture
+def fake_smtp(monkeypatch):
+    """Configure email and replace smtplib.SMTP with FakeSMTP"""
+    FakeSMTP.sessions = []
+    monkeypatch.setattr(EmailConfig, "get_smtp_config", staticmethod(lambda: dict(SMTP_CONFIG)))
+    monkeypatch.setattr(EmailConfig, "is_configured", staticmethod(lambda: True))
+    monkeypatch.setattr(email_service.smtplib, "SMTP", FakeSMTP)
+    return FakeSMTP
+
+
+def make_recipient(email: str) -> dict:
+    """Recipient dict as expected by send_bulk_emails"""
+    return {
+        'email': email,
+        'company_name': 'Acme Pharma',
+        'event_name': 'ASCO Direct 2026',
+        'docx_buffer': BytesIO(b'docx-bytes'),
+        'pdf_buffer': BytesIO(b'pdf-bytes'),
+    }
+
+
+class TestEmailTemplates:
+    """Test EmailTemplates"""
+
+    def test_values_are_html_escaped(self):
+        """Test company and event names cannot inject HTML"""
+        subject, body = EmailTemplates.get_loa_template('Smith & Sons <Pharma>', 'ASCO "Direct" 2026')
+
+        assert subject == 'Letter of Agreement - ASCO "Direct" 2026'
+        assert 'Dear Smith &amp; Sons &lt;Pharma&gt; Team,' in body
+        assert '<strong>ASCO &quot;Direct&quot; 2026</strong>' in body
+
+    def test_missing_company_name(self):
+        """Test a missing company name renders instead of raising"""
+        subject, body = EmailTemplates.get_lor_template(None, 'ASCO Direct 2026')
+
+        assert subject == 'Letter of Recognition - ASCO Direct 2026'
+        assert 'Dear  Team,' in body
+
+
+class TestEmailSender:
+    """Test EmailSender"""
+
+    def test_send_document(self, fake_smtp):
+        """Test a single send builds subject and both attachments"""
+        success, message = EmailSender.send_document(
+            to_email='buyer@example.com',
+            company_name='Acme Pharma',
+            event_name='ASCO Direct 2026',
+            document_type='LOA',
+            docx_buffer=BytesIO(b'docx-bytes'),
+            pdf_buffer=BytesIO(b'pdf-bytes'),
+        )
+
+        assert success, message
+        msg = fake_smtp.sessions[0].sent[0]
+        assert msg['Subject'] == 'Letter of Agreement - ASCO Direct 2026'
+        filenames = [part.get_filename() for part in msg.walk() if part.get_filename()]
+        assert filenames == ['LOA_Acme_Pharma.pdf', 'LOA_Acme_Pharma.docx']
+
+    def test_bulk_send_reuses_sessions(self, fake_smtp):
+        """Test bulk sends share a few sessions and report per-recipient failures"""
+        recipients = [make_recipient(f'buyer{i}@example.com') for i in range(9)]
+        recipients.append(make_recipient('reject@example.com'))
+
+        success, error_count, errors = EmailSender.send_bulk_emails(recipients, 'LOR')
+
+        assert success == 9
+        assert error_count == 1
+        assert errors[0].startswith('reject@example.com: SMTP error')
+        assert len(fake_smtp.sessions) == email_service.BULK_SEND_WORKERS
+        assert all(session.logins == 1 for session in fake_smtp.sessions)
+        assert sum(len(session.sent) for session in fake_smtp.sessions) == 9
@@ -6,6 +6,8 @@ import pytest
 from pathlib import Path
 import tempfile
 import sqlite3
+import threading
+from io import BytesIO
 
 from services.event_database import EventDatabase
 from config.events import Event
@@ -43,6 +45,7 @@ class TestEventDatabase:
         event = temp_db.get_event_by_id(event_id)
         assert event is not None
         assert event.meeting_name == "Test Event 2025"
+        assert event.id == event_id
 
     def test_add_duplicate_event(self, temp_db):
         """Test that duplicate event names are rejected"""
@@ -64,6 +67,14 @@ class TestEventDatabase:
                 year=2025
             )
 
+    def test_add_duplicate_event_ignored(self, temp_db):
+        """Test ignore_duplicates reports an existing name as 0"""
+        event_id = temp_db.add_event("Unique Event", "May 1, 2025", "Venue", "NYC", 2025)
+
+        assert temp_db.add_event("Unique Event", "June 1, 2025", "Venue", "LA", 2025, ignore_duplicates=True) == 0
+        assert temp_db.get_event_by_id(event_id).city_state == "NYC"
+        assert temp_db.count_events() == 1
+
     def test_get_all_events(self, temp_db):
         """Test retrieving all events"""
         # Add multiple events
@@ -73,6 +84,7 @@ class TestEventDatabase:
 
         all_events = temp_db.get_all_events()
         assert len(all_events) == 3
+        assert [e.year for e in all_events] == [2026, 2025, 2025]
 
         # Filter by year
         events_2025 = temp_db.get_all_events(year=2025)
@@ -95,6 +107,23 @@ class TestEventDatabase:
         results = temp_db.search_events("Best")
         assert len(results) == 1
 
+        # Exact name and blank queries
+        results = temp_db.search_events(" Best of ASCO 2025 ")
+        assert [e.meeting_name for e in results] == ["Best of ASCO 2025"]
+        assert len(temp_db.search_events("  ")) == 3
+
+    def test_search_index_follows_changes(self, temp_db):
+        """Test substring search sees renamed and deleted events"""
+        event_id = temp_db.add_event("Liver Meeting 2025", "July 1, 2025", "Venue", "CHI", 2025)
+        assert [e.meeting_name for e in temp_db.search_events("IVER")] == ["Liver Meeting 2025"]
+
+        temp_db.update_event(event_id, "Hepatology Summit 2025", "July 1, 2025", "Venue", "CHI", 2025)
+        assert temp_db.search_events("iver") == []
+        assert len(temp_db.search_events("patolo")) == 1
+
+        temp_db.delete_event(event_id)
+        assert temp_db.search_events("patolo") == []
+
     def test_update_event(self, temp_db):
         """Test updating an event"""
         event_id = temp_db.add_event(
@@ -140,6 +169,49 @@ class TestEventDatabase:
         event = temp_db.get_event_by_id(event_id)
         assert event is None
 
+    def test_concurrent_adds(self, temp_db):
+        """Test sessions on different threads can share the connection"""
+        def add_events(prefix):
+            for i in range(25):
+                temp_db.add_event(f"{prefix} Event {i}", "May 1, 2025", "Venue", "NYC", 2025)
+
+        threads = [threading.Thread(target=add_events, args=(f"T{t}",)) for t in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert temp_db.count_events() == 100
+
+    def test_add_events_batch(self, temp_db):
+        """Test batch adds return IDs in order and are all-or-nothing"""
+        rows = [(f"Event {i}", "May 1, 2025", "Venue", "NYC", 2025) for i in range(3)]
+
+        event_ids = temp_db.add_events(rows)
+        assert [temp_db.get_event_by_id(i).meeting_name for i in event_ids] == ["Event 0", "Event 1", "Event 2"]
+
+        with pytest.raises(sqlite3.IntegrityError):
+            temp_db.add_events([("Event 3", "May 1, 2025", "Venue", "NYC", 2025), rows[0]])
+        assert temp_db.count_events() == 3
+
+        event_ids = temp_db.add_events([rows[0], ("Event 3", "May 1, 2025", "Venue", "NYC", 2025)], ignore_duplicates=True)
+        assert event_ids[0] == 0 and event_ids[1] > 0
+        assert temp_db.count_events() == 4
+
+    def test_cached_reads_see_writes(self, temp_db):
+        """Test cached reads are refreshed after each kind of write"""
+        event_id = temp_db.add_event("Event 1", "May 1, 2025", "Venue", "NYC", 2025)
+        assert temp_db.get_years() == [2025]
+        assert len(temp_db.get_all_events(2025)) == 1
+
+        temp_db.update_event(event_id, "Event 1", "May 1, 2026", "Venue", "NYC", 2026)
+        assert temp_db.get_years() == [2026]
+        assert temp_db.get_all_events(2025) == []
+
+        temp_db.delete_events_by_year(2026)
+        assert temp_db.count_events() == 0
+        assert temp_db.get_all_events() == []
+
     def test_count_events(self, temp_db):
         """Test counting events"""
         assert temp_db.count_events() == 0
@@ -173,6 +245,82 @@ class TestCSVOperations:
         assert 'Event 2' in content
         assert 'Meeting Name' in content  # Header
 
+    def test_import_from_csv(self, temp_db):
+        """Test importing events from CSV, skipping invalid and duplicate rows"""
+        temp_db.add_event("Existing Event 2025", "May 1, 2025", "Venue", "NYC", 2025)
+
+        csv_file = BytesIO(
+            b"Meeting Name,Date,Venue,City/State,Year\n"
+            b"New Event 2025,June 1 2025,Venue 1,LA,2025\n"
+            b"Existing Event 2025,May 1 2025,Venue,NYC,2025\n"
+            b"Bad Year Event,July 1 2025,Venue 2,CHI,soon\n"
+            b"Missing Fields Event,,,,2025\n"
+            b"New Event 2026,June 1 2026,Venue 3,SF,2026\n"
+        )
+
+        success, error_count, errors = temp_db.import_from_csv(csv_file)
+
+        assert success == 2
+        assert error_count == 3
+        assert errors == [
+            "Row 3: Duplicate event 'Existing Event 2025'",
+            "Row 4: Invalid year value",
+            "Row 5: Missing required fields",
+        ]
+        assert temp_db.count_events() == 3
+
+    def test_import_from_csv_header_mapping(self, temp_db):
+        """Test headers match regardless of case, order, spacing or a BOM"""
+        csv_file = BytesIO(
+            "\ufeffYEAR, venue ,City,meeting name,DATE\n"
+            "2025,Venue 1,LA,New Event 2025,June 1 2025\n".encode('utf-8')
+        )
+
+        success, error_count, errors = temp_db.import_from_csv(csv_file)
+
+        assert (success, errors) == (1, [])
+        assert temp_db.get_event_by_name("New Event 2025").city_state == "LA"
+
+    def test_import_from_text_file_left_open(self, temp_db, tmp_path):
+        """Test a caller's text file stays usable after import"""
+        csv_path = tmp_path / "events.csv"
+        csv_path.write_text("Meeting Name,Date,Venue,City/State,Year\nNew Event 2025,June 1 2025,Venue 1,LA,2025\n")
+
+        with open(csv_path, newline='') as f:
+            success, error_count, errors = temp_db.import_from_csv(f)
+            f.seek(0)
+            assert f.readline().startswith("Meeting Name")
+
+        assert (success, errors) == (1, [])
+
+    def test_import_from_csv_is_all_or_nothing(self, temp_db):
+        """Test a file that fails part-way imports no rows"""
+        rows = b"".join(
+            b"Event %d,June 1 2025,Venue,LA,2025\n" % i for i in range(500)
+        )
+        csv_file = BytesIO(b"Meeting Name,Date,Venue,City/State,Year\n" + rows + b"Bad \xff Event,June 1 2025,Venue,LA,2025\n")
+
+        success, error_count, errors = temp_db.import_from_csv(csv_file)
+
+        assert success == 0
+        assert errors[0].startswith("Failed to parse CSV")
+        assert temp_db.count_events() == 0
+
+
+class TestMigration:
+    """Test migration from hardcoded events"""
+
+    def test_migrate_skips_existing_events(self, temp_db):
+        """Test migrated events are inserted once and re-runs count duplicates"""
+        events = [
+            Event("ASCO Direct 2025", "May 1, 2025", "Venue 1", "NYC", "tier_1"),
+            Event("Best of ASCO 2026", "June 1, 2026", "Venue 2", "LA", "tier_1"),
+        ]
+
+        assert temp_db.migrate_from_hardcoded_events(events) == (2, 0)
+        assert temp_db.migrate_from_hardcoded_events(events) == (0, 2)
+        assert temp_db.get_years() == [2026, 2025]
+
 
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
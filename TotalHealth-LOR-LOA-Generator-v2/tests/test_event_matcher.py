@@ -64,6 +64,18 @@ class TestEventMatcher:
         assert len(similar) <= 3
         assert all(isinstance(score, float) for _, score in similar)
 
+    def test_build_index(self):
+        """Test the index is keyed by normalized name"""
+        events = [
+            Event("ASCO Direct Denver 2026", "June 1, 2026", "Venue", "Denver, CO", "tier_1"),
+            Event("Liver Meeting 2026", "July 1, 2026", "Venue", "Chicago, IL", "tier_1"),
+        ]
+
+        index = EventMatcher.build_index(events)
+
+        assert index[EventMatcher._normalize_name("Best of ASCO  Denver 2026")] is events[0]
+        assert EventMatcher(events).match_event("liver meeting") is events[1]
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
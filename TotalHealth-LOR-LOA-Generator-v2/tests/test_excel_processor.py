@@ -29,6 +29,32 @@ class TestExcelProcessor:
         assert 'Event Name' in df.columns
         assert 'Total' in df.columns
 
+    def test_parse_excel_file(self):
+        """Test parsing a whole sheet, including blank cells and numbers"""
+        df = pd.DataFrame({
+            'Exhibitor Invite': [' Test Company ', None],
+            'Event Name': ['ASCO Direct 2025', 'Best of ASCO 2025'],
+            'Total': ['$5,000.00', 7500],
+            'Expected Attendance': [250, 300],
+            'Date': [pd.Timestamp('2025-06-01'), None],
+        })
+        buffer = BytesIO()
+        df.to_excel(buffer, index=False, engine='openpyxl')
+        buffer.seek(0)
+
+        rows, errors = ExcelProcessor.parse_excel_file(buffer)
+
+        assert errors == []
+        assert rows[0].exhibitor_invite == 'Test Company'
+        assert rows[0].expected_attendance == 250
+        assert rows[0].row_number == 2
+        assert rows[0].date == '2025-06-01 00:00:00'
+        assert rows[1].date is None
+        assert not rows[0].has_errors()
+        assert rows[1].company_name is None
+        assert rows[1].total == '7500'
+        assert rows[1].errors == ["Missing company name"]
+
     def test_parse_row(self):
         """Test parsing a single Excel row"""
         # Create sample row
@@ -55,6 +81,28 @@ class TestExcelProcessor:
         assert excel_row.official_address == '123 Main St'
         assert not excel_row.has_errors()
 
+    def test_parse_row_from_dict(self):
+        """Test parsing a plain dict record with a blank (NaN) cell"""
+        column_map = {
+            'exhibitor_invite': 'exhibitor invite',
+            'event_name': 'event name',
+            'total': 'total',
+            'expected_attendance': 'expected attendance',
+        }
+        record = {
+            'exhibitor invite': ' Test Company ',
+            'event name': 'ASCO Direct 2025',
+            'total': 5000,
+            'expected attendance': float('nan'),
+        }
+
+        excel_row = ExcelProcessor._parse_row(record, column_map, 3)
+
+        assert excel_row.exhibitor_invite == 'Test Company'
+        assert excel_row.total == '5000'
+        assert excel_row.expected_attendance is None
+        assert not excel_row.has_errors()
+
     def test_parse_row_missing_fields(self):
         """Test parsing row with missing required fields"""
         row_data = {
@@ -122,6 +170,20 @@ class TestColumnMapping:
         assert 'exhibitor_invite' in column_map
         assert column_map['exhibitor_invite'] == 'company'
 
+    def test_shared_column_names(self):
+        """Test one column can fill several fields and the first match wins"""
+        columns = pd.Index(['location', 'amount', 'company', 'total', 'exhibitor'])
+
+        column_map = ExcelProcessor._build_column_map(columns)
+
+        assert column_map == {
+            'city': 'location',
+            'venue': 'location',
+            'total': 'amount',
+            'amount': 'amount',
+            'exhibitor_invite': 'company',
+        }
+
 
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
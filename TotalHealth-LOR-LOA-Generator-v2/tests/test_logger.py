@@ -0,0 +1,137 @@
+"""
+Tests for Audit Logger - Total Health Conferencing
+Tests the JSONL log file, background writes and duplicate suppression
+"""
+import pytest
+from pathlib import Path
+import tempfile
+import shutil
+import json
+import threading
+
+import core.logger as logger
+from core.logger import AuditLogger, log_generation, flush_logs
+
+
+@pytest.fixture
+def temp_logger(monkeypatch):
+    """Point the global audit logger at a temporary log file"""
+    temp_dir = Path(tempfile.mkdtemp())
+    monkeypatch.setattr(logger, "audit_logger", AuditLogger(str(temp_dir / "log.jsonl")))
+    monkeypatch.setattr(logger, "_recent_hashes", {})
+    yield logger.audit_logger
+    shutil.rmtree(temp_dir)
+
+
+class TestLogGeneration:
+    """Test the log_generation convenience function"""
+
+    def test_entry_written_after_flush(self, temp_logger):
+        """Test queued entries reach the log file"""
+        assert log_generation("Acme Pharma", "ASCO Direct 2026", "LOR", "tier_1", [], 5000.0)
+        flush_logs()
+
+        logs = temp_logger.get_all_logs()
+        assert len(logs) == 1
+        assert logs[0]["company_name"] == "Acme Pharma"
+
+    def test_duplicate_submission_logged_once(self, temp_logger):
+        """Test identical submissions within the dedupe window are skipped"""
+        for _ in range(3):
+            log_generation("Acme Pharma", "ASCO Direct 2026", "LOR", "tier_1", [], 5000.0)
+        log_generation("Acme Pharma", "ASCO Direct 2026", "LOA", "tier_1", [], 5000.0)
+        flush_logs()
+
+        assert len(temp_logger.get_all_logs()) == 2
+
+    def test_same_submission_from_two_sessions_logged_twice(self, temp_logger, monkeypatch):
+        """Test dedupe only absorbs re-clicks within one session"""
+        for session_id in ("session-a", "session-b", "session-a"):
+            monkeypatch.setattr(logger, "get_current_user_context", lambda: {
+                "user_role": "user", "session_id": session_id
+            })
+            log_generation("Acme Pharma", "ASCO Direct 2026", "LOR", "tier_1", [], 5000.0)
+        flush_logs()
+
+        assert [log["session_id"] for log in temp_logger.get_all_logs()] == ["session-a", "session-b"]
+
+    def test_concurrent_first_use_starts_one_writer(self, temp_logger, monkeypatch):
+        """Test sessions logging at the same time share a single writer thread"""
+        monkeypatch.setattr(logger, "_writer_thread", None)
+        existing = set(threading.enumerate())
+        barrier = threading.Barrier(8)
+
+        def log(i):
+            barrier.wait()
+            log_generation(f"Company {i}", "ASCO Direct 2026", "LOR", "tier_1", [], 5000.0)
+
+        threads = [threading.Thread(target=log, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        flush_logs()
+
+        writers = [t for t in threading.enumerate() if t.name == "audit-log-writer" and t not in existing]
+        assert len(writers) == 1
+        assert len(temp_logger.get_all_logs()) == 8
+
+
+class TestAuditLogFile:
+    """Test the JSONL log file format"""
+
+    def test_entries_appended_as_jsonl(self, temp_logger):
+        """Test each entry is one JSON line"""
+        temp_logger.write_entry({"company_name": "Acme Pharma"})
+        temp_logger.write_entry({"company_name": "Beta Bio"})
+
+        lines = temp_logger.log_file.read_text().splitlines()
+        assert len(lines) == 2
+        assert [log["company_name"] for log in temp_logger.get_all_logs()] == ["Acme Pharma", "Beta Bio"]
+
+    def test_concurrent_writes_with_rotation(self, temp_logger):
+        """Test concurrent appends and rotations keep every line and the count"""
+        temp_logger.max_entries = 20
+
+        def write(t):
+            for i in range(25):
+                temp_logger.write_entry({"company_name": f"T{t} {i}"})
+
+        threads = [threading.Thread(target=write, args=(t,)) for t in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        logs = temp_logger.get_all_logs()
+        assert len(logs) == temp_logger._entry_count
+        assert 20 <= len(logs) <= 22
+
+    def test_legacy_json_log_migrated(self, temp_logger):
+        """Test an old {"letters": [...]} log is converted on startup"""
+        legacy_file = temp_logger.log_file.with_suffix(".json")
+        legacy_file.write_text(json.dumps({"letters": [{"company_name": "Acme Pharma"}]}))
+
+        migrated = AuditLogger(str(temp_logger.log_file))
+
+        assert migrated.get_all_logs() == [{"company_name": "Acme Pharma"}]
+
+
+class TestCompanyKey:
+    """Test the normalized company key"""
+
+    def test_entry_records_company_key(self, temp_logger):
+        """Test built entries carry a stripped, lowercased company key"""
+        entry = temp_logger.build_entry("  Acme Pharma ", "ASCO Direct 2026", "LOR", "tier_1", [], 5000.0)
+
+        assert entry["company_key"] == "acme pharma"
+
+    def test_backfill_adds_missing_keys(self, temp_logger):
+        """Test old entries gain company_key and variants count once"""
+        temp_logger.write_entry({"company_name": "Acme Pharma"})
+        temp_logger.write_entry({"company_name": "ACME PHARMA "})
+
+        assert temp_logger.backfill_company_keys() == 2
+        assert temp_logger.backfill_company_keys() == 0
+        assert {log["company_key"] for log in temp_logger.get_all_logs()} == {"acme pharma"}
+        assert temp_logger.get_statistics()["unique_companies"] == 1
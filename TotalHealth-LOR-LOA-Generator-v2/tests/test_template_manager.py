@@ -3,23 +3,20 @@ Tests for Template Manager - Total Health Conferencing
 Tests template CRUD operations and rendering
 """
 import pytest
-from pathlib import Path
-import tempfile
-import shutil
+import threading
 
 from services.template_manager import (
     TemplateManager,
     DocumentTemplate,
+    DEFAULT_LOR_TEMPLATE,
     get_template_manager
 )
 
 
 @pytest.fixture
-def temp_templates_dir():
+def temp_templates_dir(tmp_path):
     """Create temporary templates directory"""
-    temp_dir = Path(tempfile.mkdtemp())
-    yield temp_dir
-    shutil.rmtree(temp_dir)
+    return tmp_path / "templates"
 
 
 @pytest.fixture
@@ -66,6 +63,20 @@ class TestDocumentTemplate:
         assert "Dear Acme Corp" in rendered
         assert "Event: ASCO 2025" in rendered
 
+    def test_render_single_pass(self):
+        """Test values are not re-substituted and unknown variables are kept"""
+        template = DocumentTemplate(
+            template_id="test",
+            name="Test",
+            document_type="LOR",
+            content="{company_name} at {meeting_name} in {venue}",
+            variables=["company_name", "meeting_name", "venue"]
+        )
+
+        rendered = template.render({"company_name": "{meeting_name} Inc", "meeting_name": "ASCO"})
+
+        assert rendered == "{meeting_name} Inc at ASCO in {venue}"
+
     def test_template_serialization(self):
         """Test converting template to/from dict"""
         template = DocumentTemplate(
@@ -101,6 +112,22 @@ class TestTemplateManager:
         assert lor_template.is_default
         assert loa_template.is_default
 
+    def test_default_templates_not_written(self, temp_templates_dir):
+        """Test defaults come from memory until a saved file overrides them"""
+        manager = TemplateManager(temp_templates_dir)
+        assert not (temp_templates_dir / "default_lor.json").exists()
+
+        builtin = manager.get_template("default_lor")
+        manager.save_template(DocumentTemplate(
+            template_id="default_lor", name="Default LOR", document_type="LOR",
+            content="Custom {company_name}", variables=["company_name"], is_default=True
+        ))
+
+        fresh = TemplateManager(temp_templates_dir)
+        assert fresh.get_template("default_lor").content == "Custom {company_name}"
+        assert [t.template_id for t in fresh.list_templates("LOR")] == ["default_lor"]
+        assert builtin.content == DEFAULT_LOR_TEMPLATE
+
     def test_save_and_get_template(self, template_manager):
         """Test saving and retrieving a template"""
         template = DocumentTemplate(
@@ -133,6 +160,55 @@ class TestTemplateManager:
         loa_templates = template_manager.list_templates(document_type="LOA")
         assert len(loa_templates) >= 1
 
+    def test_list_template_metadata(self, template_manager):
+        """Test listings come from the manifest and follow saves and deletes"""
+        template_manager.save_template(DocumentTemplate(
+            template_id="custom", name="Custom", document_type="LOR",
+            content="Test", variables=[]
+        ))
+        (template_manager.templates_dir / "custom.json").unlink()
+
+        metadata = template_manager.list_template_metadata("LOR")
+        assert [m['template_id'] for m in metadata] == ["default_lor", "custom"]
+        assert metadata[1] == {
+            'template_id': "custom", 'name': "Custom", 'document_type': "LOR", 'is_default': False
+        }
+
+        template_manager.save_template(DocumentTemplate(
+            template_id="custom", name="Custom", document_type="LOR",
+            content="Test", variables=[]
+        ))
+        assert template_manager.delete_template("custom")
+        assert [m['template_id'] for m in template_manager.list_template_metadata("LOR")] == ["default_lor"]
+
+    def test_concurrent_saves(self, template_manager):
+        """Test saves from several threads all reach the files and the manifest"""
+        def save(i):
+            template_manager.save_template(DocumentTemplate(
+                template_id=f"t{i}", name=f"T{i}", document_type="LOR",
+                content="Test", variables=[]
+            ))
+
+        threads = [threading.Thread(target=save, args=(i,)) for i in range(16)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        fresh = TemplateManager(template_manager.templates_dir)
+        assert len(fresh.list_templates("LOR")) == 17
+        assert not list(fresh.templates_dir.glob("*.tmp"))
+
+    def test_index_rebuilt_when_missing(self, template_manager):
+        """Test a missing manifest is rebuilt from the template files"""
+        template_manager.create_template("Extra", "LOA", "Hi {company_name}")
+        (template_manager.templates_dir / "_index.json").unlink()
+
+        fresh = TemplateManager(template_manager.templates_dir)
+
+        assert [t.name for t in fresh.list_templates("LOA")] == ["Default LOA", "Extra"]
+        assert (fresh.templates_dir / "_index.json").exists()
+
     def test_create_template(self, template_manager):
         """Test creating a new template"""
         template = template_manager.create_template(
@@ -147,6 +223,45 @@ class TestTemplateManager:
         assert "company_name" in template.variables
         assert "venue" in template.variables
 
+    def test_create_template_variables_ordered(self, template_manager):
+        """Test extracted variables are deduplicated in first-use order"""
+        template = template_manager.create_template(
+            name="Repeats",
+            document_type="LOR",
+            content="{venue}: {company_name}, {venue} and {company_name} at {meeting_name}"
+        )
+
+        assert template.variables == ["venue", "company_name", "meeting_name"]
+
+    def test_get_template_cached(self, template_manager):
+        """Test templates are read from disk once and saves refresh the cache"""
+        template_manager.save_template(DocumentTemplate(
+            template_id="cached", name="Cached", document_type="LOR",
+            content="v1", variables=[]
+        ))
+        fresh = TemplateManager(template_manager.templates_dir)
+
+        first = fresh.get_template("cached")
+        (fresh.templates_dir / "cached.json").unlink()
+        assert fresh.get_template("cached") is first
+
+        fresh.save_template(DocumentTemplate(
+            template_id="cached", name="Cached", document_type="LOR",
+            content="v2", variables=[]
+        ))
+        assert fresh.get_template("cached").content == "v2"
+
+    def test_non_ascii_round_trip(self, template_manager):
+        """Test template files are UTF-8 whatever the platform encoding"""
+        content = "“Dear {company_name}” — Café €"
+        template_manager.create_template("Unicode", "LOR", content)
+
+        fresh = TemplateManager(template_manager.templates_dir)
+        template = fresh.list_templates("LOR")[1]
+
+        assert template.content == content
+        assert content.encode('utf-8') in (fresh.templates_dir / f"{template.template_id}.json").read_bytes()
+
     def test_delete_template(self, template_manager):
         """Test deleting a template"""
         # Create a custom template